@@ -0,0 +1,41 @@
+"""Add full-text search vector to products
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.add_column('products',
+        sa.Column(
+            'search_vec',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+                "setweight(to_tsvector('simple', coalesce(sku, '')), 'A') || "
+                "setweight(to_tsvector('simple', coalesce(short_description, '')), 'B') || "
+                "setweight(to_tsvector('simple', coalesce(description, '')), 'B')",
+                persisted=True
+            ),
+            nullable=True
+        )
+    )
+    op.create_index('ix_products_search_vec', 'products', ['search_vec'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index('ix_products_search_vec', table_name='products')
+    op.drop_column('products', 'search_vec')
@@ -0,0 +1,37 @@
+"""Add product attributes and GIN indexes for containment filters
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.add_column('products', sa.Column('attributes', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.create_index('ix_products_tags', 'products', ['tags'], unique=False, postgresql_using='gin')
+    op.create_index(
+        'ix_products_attributes',
+        'products',
+        ['attributes'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'attributes': 'jsonb_path_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index('ix_products_attributes', table_name='products')
+    op.drop_index('ix_products_tags', table_name='products')
+    op.drop_column('products', 'attributes')
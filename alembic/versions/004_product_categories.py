@@ -0,0 +1,40 @@
+"""Add product_categories association table
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_table('product_categories',
+        sa.Column('product_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('category_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['category_id'], ['categories.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('product_id', 'category_id')
+    )
+    op.create_index(op.f('ix_product_categories_category_id'), 'product_categories', ['category_id'], unique=False)
+    
+    # Carry over the existing single-category links
+    op.execute("""
+        INSERT INTO product_categories (product_id, category_id)
+        SELECT id, category_id FROM products WHERE category_id IS NOT NULL
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index(op.f('ix_product_categories_category_id'), table_name='product_categories')
+    op.drop_table('product_categories')
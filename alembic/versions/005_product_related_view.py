@@ -0,0 +1,35 @@
+"""Add product_related materialized view
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.execute("""
+        CREATE MATERIALIZED VIEW product_related AS
+        SELECT p1.product_id AS product_id,
+               p2.product_id AS related_id,
+               count(*) AS shared
+        FROM product_categories p1
+        JOIN product_categories p2 USING (category_id)
+        WHERE p1.product_id <> p2.product_id
+        GROUP BY p1.product_id, p2.product_id
+    """)
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index('ix_product_related_product_id_related_id', 'product_related', ['product_id', 'related_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS product_related')
@@ -0,0 +1,44 @@
+"""Add product_stats_view
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.execute("""
+        CREATE VIEW product_stats_view AS
+        SELECT id,
+               name,
+               view_count,
+               sales_count,
+               price * sales_count AS revenue,
+               CASE WHEN cost_price IS NOT NULL
+                    THEN (price - cost_price) * sales_count
+               END AS profit,
+               CASE WHEN cost_price IS NOT NULL
+                    THEN ((price - cost_price) / NULLIF(price, 0) * 100)::float
+               END AS profit_margin,
+               CASE WHEN view_count > 0
+                    THEN sales_count::float / view_count * 100
+                    ELSE 0
+               END AS conversion_rate,
+               rating,
+               review_count
+        FROM products
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.execute('DROP VIEW IF EXISTS product_stats_view')
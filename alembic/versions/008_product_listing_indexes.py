@@ -0,0 +1,35 @@
+"""Add composite indexes for product listings
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_index(
+        'ix_products_featured_rank',
+        'products',
+        [sa.text('rating DESC'), sa.text('created_at DESC')],
+        unique=False,
+        postgresql_where=sa.text("is_featured AND status = 'ACTIVE'")
+    )
+    op.create_index('ix_products_brand_id_status', 'products', ['brand_id', 'status'], unique=False)
+    op.create_index('ix_products_status_price', 'products', ['status', 'price'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index('ix_products_status_price', table_name='products')
+    op.drop_index('ix_products_brand_id_status', table_name='products')
+    op.drop_index('ix_products_featured_rank', table_name='products')
@@ -7,7 +7,7 @@ CRUD operations, search, filtering, inventory management, and analytics.
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies import (
@@ -159,7 +159,7 @@ async def get_featured_products(
     limit: int = Query(10, ge=1, le=50, description="Number of products to return"),
     db: AsyncSession = Depends(get_db_session),
     cache: CacheService = Depends(get_cache_service)
-) -> List[ProductSummary]:
+) -> Response:
     """Get featured products.
     
     Args:
@@ -168,10 +168,11 @@ async def get_featured_products(
         cache: Cache service
         
     Returns:
-        List of featured products
+        Pre-serialized JSON list of featured products
     """
     product_service = ProductService(db, cache)
-    return await product_service.get_featured_products(limit)
+    payload = await product_service.get_featured_products(limit)
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get(
@@ -6,6 +6,7 @@ application parameters.
 """
 
 import secrets
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 
 from pydantic import AnyHttpUrl, EmailStr, HttpUrl, PostgresDsn, RedisDsn, validator
@@ -107,6 +108,14 @@ class Settings(BaseSettings):
     # Cache Configuration
     CACHE_TTL_SECONDS: int = 3600
     CACHE_MAX_CONNECTIONS: int = 10
+    PRODUCT_CACHE_TTL_SECONDS: int = 300
+    FEATURED_CACHE_TTL_SECONDS: int = 300
+    FEATURED_CACHE_LOCK_MS: int = 5000
+    FEATURED_PRODUCTS_MAX: int = 50
+    LIST_CACHE_TTL_SECONDS: int = 30
+    VIEW_COUNT_FLUSH_INTERVAL_SECONDS: int = 60
+    BRAND_COUNT_FLUSH_INTERVAL_SECONDS: int = 30
+    RELATED_PRODUCTS_REFRESH_INTERVAL_SECONDS: int = 3600
     
     # Search Configuration
     SEARCH_RESULTS_PER_PAGE: int = 20
@@ -129,10 +138,11 @@ class Settings(BaseSettings):
     LOCKOUT_DURATION_MINUTES: int = 15
     
     # Database Pool Configuration
-    DB_POOL_SIZE: int = 20
-    DB_MAX_OVERFLOW: int = 30
+    DB_POOL_SIZE: int = 25
+    DB_MAX_OVERFLOW: int = 25
     DB_POOL_TIMEOUT: int = 30
-    DB_POOL_RECYCLE: int = 3600
+    DB_POOL_RECYCLE: int = 1800
+    DB_INSERTMANYVALUES_PAGE_SIZE: int = 1000
     
     # Application Performance
     WORKER_CONNECTIONS: int = 1000
@@ -165,17 +175,19 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
-# Global settings instance
-settings = Settings()
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get application settings.
     
     This function can be used as a dependency in FastAPI endpoints
-    to inject configuration settings.
+    to inject configuration settings. Settings are read from the
+    environment once and the same instance is returned afterwards.
     
     Returns:
         Settings: Application configuration settings
     """
-    return settings
\ No newline at end of file
+    return Settings()
+
+
+# Global settings instance
+settings = get_settings()
\ No newline at end of file
@@ -96,6 +96,14 @@ class MultiServiceSettings(BaseSettings):
     HTTP_CLIENT_TIMEOUT: int = 30
     INTER_SERVICE_TIMEOUT: int = 10
     
+    # Retry Configuration (idempotent requests only)
+    INTER_SERVICE_MAX_RETRIES: int = 2
+    INTER_SERVICE_RETRY_BACKOFF: float = 0.05  # base delay in seconds
+    
+    # Connection Pool Configuration (per downstream service)
+    INTER_SERVICE_MAX_CONNECTIONS: int = 100
+    INTER_SERVICE_POOL_TIMEOUT: float = 1.0  # seconds to wait for a free slot
+    
     # ===========================================
     # MESSAGE QUEUE CONFIGURATION
     # ===========================================
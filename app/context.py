@@ -0,0 +1,53 @@
+"""Request-scoped context shared across the application.
+
+This module holds context variables that carry per-request metadata
+(correlation IDs, trace context) from the inbound HTTP request down to
+outbound inter-service calls without threading them through every call,
+plus a per-request memo used to avoid repeating identical lookups.
+"""
+
+import functools
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Correlation ID of the inbound request (X-Request-ID header)
+REQUEST_ID: ContextVar[str] = ContextVar("request_id", default="")
+
+# W3C trace context of the inbound request (traceparent header)
+TRACEPARENT: ContextVar[str] = ContextVar("traceparent", default="")
+
+# Memoized lookup results of the inbound request (see request_memo)
+REQUEST_CACHE: ContextVar[Optional[Dict[Any, Any]]] = ContextVar("request_cache", default=None)
+
+
+def request_memo(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """Memoize an async service method for the duration of one request.
+    
+    Results are keyed on the method, the service's database session and the
+    call arguments (lists are keyed as tuples). Outside a request, where no
+    memo has been bound, the method is always called.
+    
+    Args:
+        func: Async method of a service holding a ``db`` session
+        
+    Returns:
+        Wrapped method
+    """
+    @functools.wraps(func)
+    async def wrapper(self, *args: Any) -> T:
+        cache = REQUEST_CACHE.get()
+        if cache is None:
+            return await func(self, *args)
+        
+        key = (
+            func.__qualname__,
+            id(self.db),
+            tuple(tuple(arg) if isinstance(arg, list) else arg for arg in args),
+        )
+        if key not in cache:
+            cache[key] = await func(self, *args)
+        return cache[key]
+    
+    return wrapper
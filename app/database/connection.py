@@ -7,10 +7,10 @@ and connection pooling for the PostgreSQL database using SQLAlchemy.
 import logging
 from typing import AsyncGenerator, Optional
 
-from sqlalchemy import MetaData, event, pool
+from sqlalchemy import MetaData, event, pool, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.pool import NullPool, QueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from app.config import settings
 
@@ -61,6 +61,8 @@ async def init_db_connection() -> None:
             "echo_pool": settings.DEBUG,
             "pool_pre_ping": True,
             "pool_recycle": settings.DB_POOL_RECYCLE,
+            # Rows per multi-VALUES statement when executemany INSERTs are batched
+            "insertmanyvalues_page_size": settings.DB_INSERTMANYVALUES_PAGE_SIZE,
         }
         
         # Configure connection pool based on environment
@@ -68,9 +70,9 @@ async def init_db_connection() -> None:
             # Use NullPool for testing to avoid connection issues
             engine_kwargs["poolclass"] = NullPool
         else:
-            # Use QueuePool for production with connection pooling
+            # Use the asyncio-compatible QueuePool for production pooling
             engine_kwargs.update({
-                "poolclass": QueuePool,
+                "poolclass": AsyncAdaptedQueuePool,
                 "pool_size": settings.DB_POOL_SIZE,
                 "max_overflow": settings.DB_MAX_OVERFLOW,
                 "pool_timeout": settings.DB_POOL_TIMEOUT,
@@ -94,12 +96,11 @@ async def init_db_connection() -> None:
             class_=AsyncSession,
             expire_on_commit=False,
             autoflush=True,
-            autocommit=False,
         )
         
         # Test the connection
         async with engine.begin() as conn:
-            await conn.execute("SELECT 1")
+            await conn.execute(text("SELECT 1"))
         
         logger.info("Database connection initialized successfully")
         
@@ -182,7 +183,7 @@ async def check_db_connection() -> bool:
             return False
             
         async with engine.begin() as conn:
-            await conn.execute("SELECT 1")
+            await conn.execute(text("SELECT 1"))
         return True
         
     except Exception as e:
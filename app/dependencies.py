@@ -241,7 +241,8 @@ class PaginationParams:
         self,
         page: int = 1,
         size: int = 20,
-        settings: Settings = Depends(get_config)
+        settings: Settings = Depends(get_config),
+        cursor: Optional[str] = None
     ):
         """Initialize pagination parameters.
         
@@ -249,16 +250,19 @@ class PaginationParams:
             page: Page number (1-based)
             size: Page size
             settings: Application settings
+            cursor: Keyset cursor from a previous page; replaces page
         """
         self.page = max(1, page)
         self.size = min(max(1, size), settings.MAX_PAGE_SIZE)
         self.offset = (self.page - 1) * self.size
         self.limit = self.size
+        self.cursor = cursor
 
 
 def get_pagination_params(
     page: int = 1,
     size: int = 20,
+    cursor: Optional[str] = None,
     settings: Settings = Depends(get_config)
 ) -> PaginationParams:
     """Get pagination parameters dependency.
@@ -266,12 +270,13 @@ def get_pagination_params(
     Args:
         page: Page number (1-based)
         size: Page size
+        cursor: Keyset cursor from a previous page; replaces page
         settings: Application settings
         
     Returns:
         PaginationParams: Pagination parameters
     """
-    return PaginationParams(page, size, settings)
+    return PaginationParams(page, size, settings, cursor)
 
 
 # Search and filtering dependencies
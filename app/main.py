@@ -4,10 +4,12 @@ This module initializes the FastAPI application with all necessary configuration
 middleware, routers, and startup/shutdown events.
 """
 
+import asyncio
 import logging
+import secrets
 import time
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, List
 
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
@@ -20,8 +22,14 @@ from slowapi.util import get_remote_address
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.config import settings
+from app.context import REQUEST_CACHE, REQUEST_ID, TRACEPARENT
 from app.database.connection import close_db_connection, init_db_connection
 from app.services.cache_service import close_redis_connection, init_redis_connection
+from app.services.product_service import (
+    run_brand_count_flusher,
+    run_related_products_refresher,
+    run_view_count_flusher
+)
 
 # Configure logging
 logging.basicConfig(
@@ -45,6 +53,24 @@ class ProcessTimeMiddleware(BaseHTTPMiddleware):
         return response
 
 
+class RequestContextMiddleware(BaseHTTPMiddleware):
+    """Middleware to bind the request correlation ID, trace context and lookup memo."""
+    
+    async def dispatch(self, request: Request, call_next):
+        request_id = request.headers.get("X-Request-ID") or secrets.token_hex(16)
+        request_id_token = REQUEST_ID.set(request_id)
+        traceparent_token = TRACEPARENT.set(request.headers.get("traceparent", ""))
+        request_cache_token = REQUEST_CACHE.set({})
+        try:
+            response = await call_next(request)
+        finally:
+            REQUEST_ID.reset(request_id_token)
+            TRACEPARENT.reset(traceparent_token)
+            REQUEST_CACHE.reset(request_cache_token)
+        response.headers["X-Request-ID"] = request_id
+        return response
+
+
 class LoggingMiddleware(BaseHTTPMiddleware):
     """Middleware to log requests and responses."""
     
@@ -79,6 +105,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
     logger.info("Starting up E-Commerce Product Catalog Microservice...")
     
+    # Kept so the tasks are not garbage collected and can be cancelled
+    background_tasks: List[asyncio.Task] = []
+    
     try:
         # Initialize database connection
         # await init_db_connection()
@@ -88,6 +117,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         # await init_redis_connection()
         # logger.info("Redis connection initialized")
         
+        # Write buffered product views and brand product counts to the database
+        background_tasks.append(asyncio.create_task(run_view_count_flusher()))
+        background_tasks.append(asyncio.create_task(run_brand_count_flusher()))
+        
+        # Keep the related-products materialized view current
+        background_tasks.append(asyncio.create_task(run_related_products_refresher()))
+        
         logger.info("Application startup completed successfully (DB/Redis temporarily disabled)")
         
     except Exception as e:
@@ -100,6 +136,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Shutting down E-Commerce Product Catalog Microservice...")
     
     try:
+        # Stop background tasks
+        for task in background_tasks:
+            task.cancel()
+        await asyncio.gather(*background_tasks, return_exceptions=True)
+        
         # Close database connection
         # await close_db_connection()
         # logger.info("Database connection closed")
@@ -149,6 +190,7 @@ if settings.is_production:
 
 # Add custom middleware
 app.add_middleware(ProcessTimeMiddleware)
+app.add_middleware(RequestContextMiddleware)
 if settings.DEBUG:
     app.add_middleware(LoggingMiddleware)
 
@@ -7,7 +7,15 @@ for the e-commerce product catalog system.
 from app.models.base import Base
 from app.models.brand import Brand
 from app.models.category import Category
-from app.models.product import Product, ProductImage, ProductStatus, ProductType
+from app.models.product import (
+    Product,
+    ProductImage,
+    ProductStatus,
+    ProductType,
+    product_categories,
+    product_related,
+    product_stats_view,
+)
 from app.models.user import User
 
 __all__ = [
@@ -19,4 +27,7 @@ __all__ = [
     "ProductImage",
     "ProductStatus",
     "ProductType",
+    "product_categories",
+    "product_related",
+    "product_stats_view",
 ]
\ No newline at end of file
@@ -9,13 +9,84 @@ from decimal import Decimal
 from enum import Enum as PyEnum
 from typing import List, Optional
 
-from sqlalchemy import Boolean, Enum, ForeignKey, Integer, Numeric, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Computed,
+    Enum,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Table,
+    Text,
+    column,
+    table,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
 
 
+# Weighted full-text document for product search ('simple' keeps SKUs intact)
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(sku, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(short_description, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+)
+
+
+# Many-to-many link between products and the categories they are listed in
+product_categories = Table(
+    "product_categories",
+    Base.metadata,
+    Column(
+        "product_id",
+        UUID(as_uuid=True),
+        ForeignKey("products.id", ondelete="CASCADE"),
+        primary_key=True
+    ),
+    Column(
+        "category_id",
+        UUID(as_uuid=True),
+        ForeignKey("categories.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True
+    ),
+)
+
+
+# Materialized view of products sharing categories (see migration 005);
+# read-only, so it is declared as a lightweight table outside the metadata
+product_related = table(
+    "product_related",
+    column("product_id", UUID(as_uuid=True)),
+    column("related_id", UUID(as_uuid=True)),
+    column("shared", Integer),
+)
+
+
+# Plain view exposing derived sales metrics per product (see migration 006)
+product_stats_view = table(
+    "product_stats_view",
+    column("id", UUID(as_uuid=True)),
+    column("name", String),
+    column("view_count", Integer),
+    column("sales_count", Integer),
+    column("revenue", Numeric),
+    column("profit", Numeric),
+    column("profit_margin", Float),
+    column("conversion_rate", Float),
+    column("rating", Numeric),
+    column("review_count", Integer),
+)
+
+
 class ProductStatus(str, PyEnum):
     """Product status enumeration."""
     DRAFT = "draft"
@@ -42,6 +113,31 @@ class Product(Base):
     """
     
     __tablename__ = "products"
+    __table_args__ = (
+        Index("ix_products_search_vec", "search_vec", postgresql_using="gin"),
+        Index("ix_products_tags", "tags", postgresql_using="gin"),
+        Index(
+            "ix_products_sku_trgm",
+            "sku",
+            postgresql_using="gin",
+            postgresql_ops={"sku": "gin_trgm_ops"}
+        ),
+        Index(
+            "ix_products_attributes",
+            "attributes",
+            postgresql_using="gin",
+            postgresql_ops={"attributes": "jsonb_path_ops"}
+        ),
+        # Featured listing: filter and sort order served by one partial index
+        Index(
+            "ix_products_featured_rank",
+            text("rating DESC"),
+            text("created_at DESC"),
+            postgresql_where=text("is_featured AND status = 'ACTIVE'")
+        ),
+        Index("ix_products_brand_id_status", "brand_id", "status"),
+        Index("ix_products_status_price", "status", "price"),
+    )
     
     # Basic product information
     name: Mapped[str] = mapped_column(
@@ -129,7 +225,8 @@ class Product(Base):
         nullable=False
     )
     
-    # Product relationships
+    # Product relationships; product_categories holds every category link
+    # and category_id mirrors the first one as the primary category
     category_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("categories.id", ondelete="SET NULL"),
@@ -215,6 +312,26 @@ class Product(Base):
         nullable=True
     )
     
+    # Tags and free-form attributes, filtered with containment (@>)
+    tags: Mapped[Optional[List[str]]] = mapped_column(
+        ARRAY(String),
+        nullable=True
+    )
+    
+    attributes: Mapped[Optional[dict]] = mapped_column(
+        JSONB,
+        default=dict,
+        nullable=True
+    )
+    
+    # Full-text search vector, maintained by PostgreSQL
+    search_vec: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+        nullable=True,
+        deferred=True
+    )
+    
     # Analytics and metrics
     view_count: Mapped[int] = mapped_column(
         Integer,
@@ -246,6 +363,11 @@ class Product(Base):
         back_populates="products"
     )
     
+    categories: Mapped[List["Category"]] = relationship(
+        "Category",
+        secondary=product_categories
+    )
+    
     brand: Mapped[Optional["Brand"]] = relationship(
         "Brand",
         back_populates="products"
@@ -53,6 +53,7 @@ class PaginationParams(BaseModel):
     
     page: int = Field(1, ge=1, description="Page number (1-based)")
     size: int = Field(20, ge=1, le=100, description="Page size")
+    cursor: Optional[str] = Field(None, description="Keyset cursor from a previous page; replaces page")
     
     @property
     def offset(self) -> int:
@@ -78,10 +79,11 @@ class PaginationMeta(BaseModel):
     
     page: int = Field(description="Current page number")
     size: int = Field(description="Page size")
-    total: int = Field(description="Total number of items")
-    pages: int = Field(description="Total number of pages")
+    total: Optional[int] = Field(description="Total number of items (not computed in cursor mode)")
+    pages: Optional[int] = Field(description="Total number of pages (not computed in cursor mode)")
     has_next: bool = Field(description="Whether there is a next page")
     has_prev: bool = Field(description="Whether there is a previous page")
+    next_cursor: Optional[str] = Field(None, description="Cursor for fetching the next page by keyset")
     
     class Config:
         schema_extra = {
@@ -108,7 +110,8 @@ class PaginatedResponse(BaseModel, Generic[T]):
         items: List[T],
         page: int,
         size: int,
-        total: int
+        total: int,
+        next_cursor: Optional[str] = None
     ) -> "PaginatedResponse[T]":
         """Create paginated response with calculated metadata.
         
@@ -117,6 +120,7 @@ class PaginatedResponse(BaseModel, Generic[T]):
             page: Current page number
             size: Page size
             total: Total number of items
+            next_cursor: Cursor for continuing after this page by keyset
             
         Returns:
             PaginatedResponse instance
@@ -129,7 +133,37 @@ class PaginatedResponse(BaseModel, Generic[T]):
             total=total,
             pages=pages,
             has_next=page < pages,
-            has_prev=page > 1
+            has_prev=page > 1,
+            next_cursor=next_cursor
+        )
+        
+        return cls(items=items, meta=meta)
+    
+    @classmethod
+    def create_from_cursor(
+        cls,
+        items: List[T],
+        size: int,
+        next_cursor: Optional[str]
+    ) -> "PaginatedResponse[T]":
+        """Create a keyset-paginated response, which carries no totals.
+        
+        Args:
+            items: List of items
+            size: Page size
+            next_cursor: Cursor for the next page, None on the last page
+            
+        Returns:
+            PaginatedResponse instance
+        """
+        meta = PaginationMeta(
+            page=1,
+            size=size,
+            total=None,
+            pages=None,
+            has_next=next_cursor is not None,
+            has_prev=True,
+            next_cursor=next_cursor
         )
         
         return cls(items=items, meta=meta)
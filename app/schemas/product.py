@@ -386,7 +386,7 @@ class ProductSummary(BaseModel):
     sku: str = Field(description="Stock Keeping Unit")
     price: Decimal = Field(description="Product price")
     compare_price: Optional[Decimal] = Field(None, description="Compare at price")
-    currency: str = Field(description="Currency code")
+    currency: str = Field("USD", max_length=3, description="Currency code")
     stock_quantity: int = Field(description="Available stock quantity")
     status: ProductStatus = Field(description="Product status")
     is_featured: bool = Field(description="Whether product is featured")
@@ -455,8 +455,8 @@ class ProductBulkOperation(BaseModel):
     """Schema for bulk product operations."""
     
     product_ids: List[str] = Field(description="List of product IDs")
-    operation: str = Field(description="Operation type (activate, deactivate, delete, feature, unfeature, update_stock)")
-    data: Optional[Dict] = Field(None, description="Additional data for the operation")
+    operation: str = Field(description="Operation type (activate, deactivate, delete, feature, unfeature, update_stock, update_price)")
+    data: Optional[Dict] = Field(None, description="Additional data for the operation (update_price takes 'price' for all products or 'prices' mapping product ID to price)")
     
     @validator("operation")
     def validate_operation(cls, v):
@@ -543,10 +543,20 @@ class ProductSearch(BaseModel):
     sort_by: str = Field("created_at", description="Sort field")
     sort_order: str = Field("desc", description="Sort order (asc, desc)")
     
+    @validator("tags")
+    def validate_tags(cls, v):
+        """Normalize tag filters to match stored tags.
+        
+        Sorted and de-duplicated so equivalent filters share one cache key.
+        """
+        if v is not None:
+            return sorted({tag.strip().lower() for tag in v if tag.strip()})
+        return v
+    
     @validator("sort_by")
     def validate_sort_by(cls, v):
         """Validate sort field."""
-        allowed_fields = ["name", "price", "created_at", "updated_at", "rating", "sales_count", "view_count"]
+        allowed_fields = ["relevance", "name", "price", "created_at", "updated_at", "rating", "sales_count", "view_count"]
         if v not in allowed_fields:
             raise ValueError(f"Sort field must be one of: {', '.join(allowed_fields)}")
         return v
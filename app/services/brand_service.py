@@ -4,8 +4,11 @@ This module provides functionality for BrandModel CRUD operations,
 brand analytics, and BrandModel management.
 """
 
+import hashlib
 from typing import Dict, List, Optional
+from uuid import UUID
 
+import orjson
 from fastapi import HTTPException, status
 from sqlalchemy import and_, desc, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -20,9 +23,13 @@ from app.schemas.brand import (
     BrandStats,
     BrandComparison
 )
+from app.config import settings
 from app.schemas.common import PaginationParams, PaginatedResponse
 from app.services.cache_service import CacheService
 
+# Tag set holding every cached brand list
+BRAND_LIST_CACHE_TAG = "brands:list_keys"
+
 
 class BrandService:
     """Service for managing BrandModel operations."""
@@ -87,6 +94,7 @@ class BrandService:
         
         # Cache brand
         if self.cache:
+            await self.cache.invalidate_list_keys(BRAND_LIST_CACHE_TAG)
             await self.cache.set_brand(BrandModel)
         
         return brand
@@ -193,6 +201,7 @@ class BrandService:
         
         # Clear cache
         if self.cache:
+            await self.cache.invalidate_list_keys(BRAND_LIST_CACHE_TAG)
             await self.cache.delete_brand(brand_id)
         
         return brand
@@ -236,6 +245,7 @@ class BrandService:
         
         # Clear cache
         if self.cache:
+            await self.cache.invalidate_list_keys(BRAND_LIST_CACHE_TAG)
             await self.cache.delete_brand(brand_id)
     
     async def get_brands(
@@ -258,6 +268,30 @@ class BrandService:
         Returns:
             Paginated response or list of brands
         """
+        # Try cache first; lists are short-lived and dropped on brand writes
+        cache_key = None
+        if self.cache:
+            params = {
+                "active_only": active_only,
+                "featured_only": featured_only,
+                "verified_only": verified_only,
+                "search_query": search_query,
+                "page": pagination.page if pagination else None,
+                "size": pagination.size if pagination else None
+            }
+            signature = hashlib.blake2s(orjson.dumps(params, option=orjson.OPT_SORT_KEYS)).hexdigest()
+            cache_key = f"brands:list:{signature}"
+            cached = await self.cache.get(cache_key)
+            if cached:
+                items = await self._add_pending_counts(
+                    [Brand.model_validate(item) for item in cached["items"]]
+                )
+                if pagination:
+                    return PaginatedResponse.create(
+                        items, pagination.page, pagination.size, cached["total"]
+                    )
+                return items
+        
         # Build query
         query = select(BrandModel)
         
@@ -295,23 +329,89 @@ class BrandService:
             total = total_result.scalar()
             
             # Apply pagination
-            query = query.offset(pagination.skip).limit(pagination.limit)
+            query = query.offset(pagination.offset).limit(pagination.limit)
             
             # Execute query
             result = await self.db.execute(query)
-            brands = result.scalars().all()
+            brands = [self._to_schema(brand) for brand in result.scalars().all()]
             
-            return PaginatedResponse(
-                items=list(brands),
-                total=total,
-                page=pagination.page,
-                size=pagination.size,
-                pages=pagination.get_total_pages(total)
-            )
+            await self._cache_list(cache_key, brands, total)
+            brands = await self._add_pending_counts(brands)
+            return PaginatedResponse.create(brands, pagination.page, pagination.size, total)
         else:
             # Execute query without pagination
             result = await self.db.execute(query)
-            return list(result.scalars().all())
+            brands = [self._to_schema(brand) for brand in result.scalars().all()]
+            
+            await self._cache_list(cache_key, brands)
+            return await self._add_pending_counts(brands)
+    
+    async def _cache_list(
+        self,
+        cache_key: Optional[str],
+        brands: List[Brand],
+        total: Optional[int] = None
+    ) -> None:
+        """Cache a brand list result under the brand list tag.
+        
+        Args:
+            cache_key: Cache key of the list, None when caching is disabled
+            brands: Brands in the list
+            total: Total matching brands, for paginated lists
+        """
+        if not cache_key:
+            return
+        
+        await self.cache.cache_tagged_list(
+            cache_key,
+            {
+                "items": [brand.model_dump(mode="json") for brand in brands],
+                "total": total
+            },
+            [BRAND_LIST_CACHE_TAG],
+            ttl=settings.LIST_CACHE_TTL_SECONDS
+        )
+    
+    async def _add_pending_counts(self, brands: List[Brand]) -> List[Brand]:
+        """Add product count changes still buffered in Redis to brand counts.
+        
+        Product writes buffer brand count changes in Redis until the brand
+        count flusher writes them to the database.
+        
+        Args:
+            brands: Brands with their stored product counts
+            
+        Returns:
+            Brands with up-to-date product counts
+        """
+        if not self.cache:
+            return brands
+        
+        pending = await self.cache.get_pending_brand_product_counts([brand.id for brand in brands])
+        return [
+            brand.model_copy(update={"product_count": max(brand.product_count + pending[brand.id], 0)})
+            if brand.id in pending else brand
+            for brand in brands
+        ]
+    
+    @staticmethod
+    def _to_schema(brand: BrandModel) -> Brand:
+        """Build a Brand schema, converting UUID attributes to strings.
+        
+        Args:
+            brand: BrandModel instance
+            
+        Returns:
+            Brand schema
+        """
+        data = {
+            name: getattr(brand, name)
+            for name in Brand.model_fields
+            if hasattr(brand, name)
+        }
+        return Brand.model_validate(
+            {name: str(value) if isinstance(value, UUID) else value for name, value in data.items()}
+        )
     
     async def get_featured_brands(self, limit: int = 10) -> List[BrandModel]:
         """Get featured brands.
@@ -466,6 +566,7 @@ class BrandService:
         
         # Clear cache for affected brands
         if self.cache:
+            await self.cache.invalidate_list_keys(BRAND_LIST_CACHE_TAG)
             for brand_id in brand_ids:
                 await self.cache.delete_brand(brand_id)
         
@@ -633,6 +734,7 @@ class BrandService:
         
         # Clear cache
         if self.cache:
+            await self.cache.invalidate_list_keys(BRAND_LIST_CACHE_TAG)
             await self.cache.delete_brand(brand_id)
     
     async def _get_brand_by_name(self, name: str) -> Optional[BrandModel]:
@@ -5,10 +5,11 @@ and reduced database load. It includes methods for caching products, search resu
 and other frequently accessed data.
 """
 
-import json
+import hashlib
 import logging
 from typing import Any, Dict, List, Optional, Union
 
+import orjson
 import redis.asyncio as redis
 from redis.asyncio import Redis
 
@@ -19,6 +20,12 @@ logger = logging.getLogger(__name__)
 # Global Redis connection
 redis_client: Optional[Redis] = None
 
+# Hash of product ID -> views not yet written to the database
+PENDING_VIEWS_KEY = "product_views_pending"
+
+# Hash of brand ID -> product count change not yet written to the database
+PENDING_BRAND_COUNTS_KEY = "brand_product_counts_pending"
+
 
 class CacheService:
     """Redis cache service for managing cached data."""
@@ -44,12 +51,27 @@ class CacheService:
         try:
             value = await self.redis.get(key)
             if value:
-                return json.loads(value)
+                return orjson.loads(value)
             return None
         except Exception as e:
             logger.error(f"Cache get error for key {key}: {e}")
             return None
     
+    async def get_raw(self, key: str) -> Optional[str]:
+        """Get a serialized value from cache without decoding it.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached JSON payload or None if not found
+        """
+        try:
+            return await self.redis.get(key)
+        except Exception as e:
+            logger.error(f"Cache get error for key {key}: {e}")
+            return None
+    
     async def set(
         self,
         key: str,
@@ -68,7 +90,7 @@ class CacheService:
         """
         try:
             ttl = ttl or self.default_ttl
-            serialized_value = json.dumps(value, default=str)
+            serialized_value = orjson.dumps(value, default=str)
             await self.redis.setex(key, ttl, serialized_value)
             return True
         except Exception as e:
@@ -103,13 +125,40 @@ class CacheService:
         try:
             keys = await self.redis.keys(pattern)
             if keys:
-                await self.redis.delete(*keys)
+                await self.redis.unlink(*keys)
                 return len(keys)
             return 0
         except Exception as e:
             logger.error(f"Cache delete pattern error for pattern {pattern}: {e}")
             return 0
     
+    async def acquire_lock(self, key: str, ttl_ms: int) -> bool:
+        """Try to take a short-lived lock (SET NX PX).
+        
+        Args:
+            key: Key the lock protects
+            ttl_ms: Lock expiry in milliseconds, in case the holder dies
+            
+        Returns:
+            True if the lock was acquired, False otherwise
+        """
+        try:
+            return bool(await self.redis.set(f"lock:{key}", 1, nx=True, px=ttl_ms))
+        except Exception as e:
+            logger.error(f"Cache lock error for key {key}: {e}")
+            return False
+    
+    async def release_lock(self, key: str) -> bool:
+        """Release a lock taken with acquire_lock.
+        
+        Args:
+            key: Key the lock protects
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        return await self.delete(f"lock:{key}")
+    
     async def exists(self, key: str) -> bool:
         """Check if key exists in cache.
         
@@ -185,7 +234,7 @@ class CacheService:
             True if successful, False otherwise
         """
         key = f"product:{product_id}"
-        return await self.set(key, product_data)
+        return await self.set(key, product_data, settings.PRODUCT_CACHE_TTL_SECONDS)
     
     async def get_cached_product(self, product_id: str) -> Optional[Dict[str, Any]]:
         """Get cached product data.
@@ -211,6 +260,27 @@ class CacheService:
         key = f"product:{product_id}"
         return await self.delete(key)
     
+    async def delete_products(self, product_ids: List[str]) -> bool:
+        """Invalidate cache for several products in one round-trip.
+        
+        Uses UNLINK so Redis frees the values off the main thread.
+        
+        Args:
+            product_ids: Product IDs
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not product_ids:
+            return True
+        
+        try:
+            await self.redis.unlink(*(f"product:{product_id}" for product_id in product_ids))
+            return True
+        except Exception as e:
+            logger.error(f"Cache delete error for {len(product_ids)} products: {e}")
+            return False
+    
     async def cache_product_list(
         self,
         cache_key: str,
@@ -229,6 +299,67 @@ class CacheService:
         """
         return await self.set(cache_key, products, ttl)
     
+    async def cache_tagged_list(
+        self,
+        cache_key: str,
+        value: Any,
+        tags: List[str],
+        ttl: Optional[int] = None
+    ) -> bool:
+        """Cache a list result and register its key under invalidation tags.
+        
+        Args:
+            cache_key: Cache key for the list
+            value: List result to cache, or an already serialized JSON payload
+            tags: Tag sets the key is added to (see invalidate_list_keys)
+            ttl: Time to live in seconds
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            ttl = ttl or self.default_ttl
+            if not isinstance(value, (bytes, str)):
+                value = orjson.dumps(value, default=str)
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.setex(cache_key, ttl, value)
+                for tag in tags:
+                    pipe.sadd(tag, cache_key)
+                    # A tag must outlive every key in it, so its TTL is only
+                    # ever set on a new tag or extended (Redis 7 NX/GT)
+                    pipe.expire(tag, ttl, nx=True)
+                    pipe.expire(tag, ttl, gt=True)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Cache set error for tagged key {cache_key}: {e}")
+            return False
+    
+    async def invalidate_list_keys(self, *tags: str) -> int:
+        """Delete every cached list registered under any of the given tags.
+        
+        Args:
+            tags: Tag sets to invalidate
+            
+        Returns:
+            Number of cached lists deleted
+        """
+        if not tags:
+            return 0
+        
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.sunion(*tags)
+                pipe.unlink(*tags)
+                keys, _ = await pipe.execute()
+            # UNLINK frees large tag sets and payloads off the Redis main thread
+            if keys:
+                await self.redis.unlink(*keys)
+            return len(keys)
+        except Exception as e:
+            logger.error(f"Cache invalidate error for tags {tags}: {e}")
+            return 0
+    
     async def get_cached_product_list(self, cache_key: str) -> Optional[List[Dict[str, Any]]]:
         """Get cached product list.
         
@@ -291,8 +422,8 @@ class CacheService:
             Cache key string
         """
         # Sort filters for consistent key generation
-        sorted_filters = json.dumps(filters, sort_keys=True)
-        return f"search:{hash(query + sorted_filters)}"
+        sorted_filters = orjson.dumps(filters, default=str, option=orjson.OPT_SORT_KEYS)
+        return f"search:{hashlib.sha1(query.encode() + sorted_filters).hexdigest()}"
     
     # Analytics cache methods
     async def increment_search_count(self, query: str) -> Optional[int]:
@@ -319,6 +450,97 @@ class CacheService:
         key = f"product_views:{product_id}"
         return await self.increment(key)
     
+    async def add_pending_product_view(self, product_id: str, amount: int = 1) -> Optional[int]:
+        """Record a product view to be flushed to the database later.
+        
+        Args:
+            product_id: Product ID
+            amount: Number of views to add
+            
+        Returns:
+            Pending view count for the product or None if error
+        """
+        try:
+            return await self.redis.hincrby(PENDING_VIEWS_KEY, product_id, amount)
+        except Exception as e:
+            logger.error(f"Cache pending view error for product {product_id}: {e}")
+            return None
+    
+    async def pop_pending_product_views(self) -> Dict[str, int]:
+        """Atomically read and clear all pending product views.
+        
+        Returns:
+            Mapping of product ID to number of views since the last pop
+        """
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.hgetall(PENDING_VIEWS_KEY)
+                pipe.delete(PENDING_VIEWS_KEY)
+                pending, _ = await pipe.execute()
+            return {product_id: int(count) for product_id, count in pending.items()}
+        except Exception as e:
+            logger.error(f"Cache pop pending views error: {e}")
+            return {}
+    
+    # Brand counter methods
+    async def add_pending_brand_product_counts(self, deltas: Dict[str, int]) -> bool:
+        """Record brand product count changes to be flushed to the database later.
+        
+        Args:
+            deltas: Mapping of brand ID to product count change
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for brand_id, delta in deltas.items():
+                    pipe.hincrby(PENDING_BRAND_COUNTS_KEY, brand_id, delta)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Cache pending brand count error: {e}")
+            return False
+    
+    async def get_pending_brand_product_counts(self, brand_ids: List[str]) -> Dict[str, int]:
+        """Get product count changes not yet flushed for the given brands.
+        
+        Args:
+            brand_ids: Brand IDs
+            
+        Returns:
+            Mapping of brand ID to pending product count change
+        """
+        if not brand_ids:
+            return {}
+        
+        try:
+            pending = await self.redis.hmget(PENDING_BRAND_COUNTS_KEY, brand_ids)
+            return {
+                brand_id: int(delta)
+                for brand_id, delta in zip(brand_ids, pending)
+                if delta and int(delta)
+            }
+        except Exception as e:
+            logger.error(f"Cache get pending brand counts error: {e}")
+            return {}
+    
+    async def pop_pending_brand_product_counts(self) -> Dict[str, int]:
+        """Atomically read and clear all pending brand product count changes.
+        
+        Returns:
+            Mapping of brand ID to product count change since the last pop
+        """
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.hgetall(PENDING_BRAND_COUNTS_KEY)
+                pipe.delete(PENDING_BRAND_COUNTS_KEY)
+                pending, _ = await pipe.execute()
+            return {brand_id: int(delta) for brand_id, delta in pending.items() if int(delta)}
+        except Exception as e:
+            logger.error(f"Cache pop pending brand counts error: {e}")
+            return {}
+    
     # Session cache methods
     async def cache_user_session(
         self,
@@ -4,8 +4,11 @@ This module provides functionality for CategoryModel CRUD operations,
 hierarchy management, and CategoryModel analytics.
 """
 
+import hashlib
 from typing import Dict, List, Optional
+from uuid import UUID
 
+import orjson
 from fastapi import HTTPException, status
 from sqlalchemy import and_, desc, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -22,9 +25,13 @@ from app.schemas.category import (
     CategoryTree,
     CategoryWithChildren
 )
+from app.config import settings
 from app.schemas.common import PaginationParams, PaginatedResponse
 from app.services.cache_service import CacheService
 
+# Tag set holding every cached category list
+CATEGORY_LIST_CACHE_TAG = "categories:list_keys"
+
 
 class CategoryService:
     """Service for managing CategoryModel operations."""
@@ -84,6 +91,7 @@ class CategoryService:
         
         # Cache category
         if self.cache:
+            await self.cache.invalidate_list_keys(CATEGORY_LIST_CACHE_TAG)
             await self.cache.set_category(CategoryModel)
             # Clear CategoryModel tree cache
             await self.cache.delete("category_tree")
@@ -207,6 +215,7 @@ class CategoryService:
         
         # Clear cache
         if self.cache:
+            await self.cache.invalidate_list_keys(CATEGORY_LIST_CACHE_TAG)
             await self.cache.delete_category(category_id)
             await self.cache.delete("category_tree")
         
@@ -257,6 +266,7 @@ class CategoryService:
         
         # Clear cache
         if self.cache:
+            await self.cache.invalidate_list_keys(CATEGORY_LIST_CACHE_TAG)
             await self.cache.delete_category(category_id)
             await self.cache.delete("category_tree")
     
@@ -308,6 +318,7 @@ class CategoryService:
         
         # Clear cache
         if self.cache:
+            await self.cache.invalidate_list_keys(CATEGORY_LIST_CACHE_TAG)
             await self.cache.delete_category(category_id)
             await self.cache.delete("category_tree")
         
@@ -331,6 +342,27 @@ class CategoryService:
         Returns:
             Paginated response or list of categories
         """
+        # Try cache first; lists are short-lived and dropped on category writes
+        cache_key = None
+        if self.cache:
+            params = {
+                "parent_id": parent_id,
+                "active_only": active_only,
+                "featured_only": featured_only,
+                "page": pagination.page if pagination else None,
+                "size": pagination.size if pagination else None
+            }
+            signature = hashlib.blake2s(orjson.dumps(params, option=orjson.OPT_SORT_KEYS)).hexdigest()
+            cache_key = f"categories:list:{signature}"
+            cached = await self.cache.get(cache_key)
+            if cached:
+                items = [Category.model_validate(item) for item in cached["items"]]
+                if pagination:
+                    return PaginatedResponse.create(
+                        items, pagination.page, pagination.size, cached["total"]
+                    )
+                return items
+        
         # Build query
         query = select(CategoryModel).options(
             selectinload(CategoryModel.children),
@@ -365,23 +397,66 @@ class CategoryService:
             total = total_result.scalar()
             
             # Apply pagination
-            query = query.offset(pagination.skip).limit(pagination.limit)
+            query = query.offset(pagination.offset).limit(pagination.limit)
             
             # Execute query
             result = await self.db.execute(query)
-            categories = result.scalars().all()
+            categories = [self._to_schema(category) for category in result.scalars().all()]
             
-            return PaginatedResponse(
-                items=list(categories),
-                total=total,
-                page=pagination.page,
-                size=pagination.size,
-                pages=pagination.get_total_pages(total)
-            )
+            await self._cache_list(cache_key, categories, total)
+            return PaginatedResponse.create(categories, pagination.page, pagination.size, total)
         else:
             # Execute query without pagination
             result = await self.db.execute(query)
-            return list(result.scalars().all())
+            categories = [self._to_schema(category) for category in result.scalars().all()]
+            
+            await self._cache_list(cache_key, categories)
+            return categories
+    
+    async def _cache_list(
+        self,
+        cache_key: Optional[str],
+        categories: List[Category],
+        total: Optional[int] = None
+    ) -> None:
+        """Cache a category list result under the category list tag.
+        
+        Args:
+            cache_key: Cache key of the list, None when caching is disabled
+            categories: Categories in the list
+            total: Total matching categories, for paginated lists
+        """
+        if not cache_key:
+            return
+        
+        await self.cache.cache_tagged_list(
+            cache_key,
+            {
+                "items": [category.model_dump(mode="json") for category in categories],
+                "total": total
+            },
+            [CATEGORY_LIST_CACHE_TAG],
+            ttl=settings.LIST_CACHE_TTL_SECONDS
+        )
+    
+    @staticmethod
+    def _to_schema(category: CategoryModel) -> Category:
+        """Build a Category schema, converting UUID attributes to strings.
+        
+        Args:
+            category: CategoryModel instance
+            
+        Returns:
+            Category schema
+        """
+        data = {
+            name: getattr(category, name)
+            for name in Category.model_fields
+            if hasattr(category, name)
+        }
+        return Category.model_validate(
+            {name: str(value) if isinstance(value, UUID) else value for name, value in data.items()}
+        )
     
     async def get_category_tree(self, active_only: bool = True) -> List[CategoryTree]:
         """Get complete CategoryModel tree.
@@ -566,6 +641,7 @@ class CategoryService:
         
         # Clear cache for affected categories
         if self.cache:
+            await self.cache.invalidate_list_keys(CATEGORY_LIST_CACHE_TAG)
             for category_id in category_ids:
                 await self.cache.delete_category(category_id)
             await self.cache.delete("category_tree")
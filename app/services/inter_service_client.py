@@ -8,20 +8,38 @@ multi-database environment.
 import asyncio
 import json
 import logging
+import random
+import secrets
 from typing import Any, Dict, List, Optional, Union
 from uuid import uuid4
 
 import aiohttp
 import httpx
+import orjson
 from circuitbreaker import circuit
 from fastapi import HTTPException, status
 from pydantic import BaseModel
 
 from app.config_multi_service import get_multi_service_settings
+from app.context import REQUEST_ID, TRACEPARENT
+
+try:
+    import aio_pika
+    from aio_pika import ExchangeType, Message
+except ImportError:  # Event publishing is optional
+    aio_pika = None
+    ExchangeType = None
+    Message = None
 
 logger = logging.getLogger(__name__)
 settings = get_multi_service_settings()
 
+# Methods that are safe to replay after a transient connection failure
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Transport errors typically caused by a stale keep-alive socket
+RETRYABLE_ERRORS = (httpx.RemoteProtocolError, httpx.ConnectError, httpx.ReadError)
+
 
 class ServiceResponse(BaseModel):
     """Standard response model for inter-service communication."""
@@ -55,11 +73,18 @@ class BaseServiceClient:
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.session: Optional[httpx.AsyncClient] = None
+        # Caps in-flight requests at the pool size so excess callers fail fast
+        self._semaphore = asyncio.Semaphore(settings.INTER_SERVICE_MAX_CONNECTIONS)
         
     async def __aenter__(self):
         """Async context manager entry."""
         self.session = httpx.AsyncClient(
-            timeout=self.timeout,
+            timeout=httpx.Timeout(
+                self.timeout,
+                connect=settings.INTER_SERVICE_POOL_TIMEOUT,
+                pool=settings.INTER_SERVICE_POOL_TIMEOUT
+            ),
+            limits=httpx.Limits(max_connections=settings.INTER_SERVICE_MAX_CONNECTIONS),
             headers={
                 "User-Agent": f"product-service/{settings.SERVICE_VERSION}",
                 "X-Service-Name": settings.SERVICE_NAME,
@@ -102,39 +127,63 @@ class BaseServiceClient:
         if settings.ENABLE_SERVICE_AUTH:
             request_headers["X-Service-Token"] = settings.SERVICE_TO_SERVICE_SECRET
         
-        request_id = str(uuid4())
+        # Propagate the inbound correlation ID so the call chain stays traceable
+        request_id = REQUEST_ID.get() or secrets.token_hex(16)
         request_headers["X-Request-ID"] = request_id
         
+        traceparent = TRACEPARENT.get()
+        if traceparent:
+            request_headers["traceparent"] = traceparent
+        
         try:
-            logger.info(
-                f"Making {method} request to {self.service_name}",
-                extra={
-                    "service": self.service_name,
-                    "method": method,
-                    "url": url,
-                    "request_id": request_id
-                }
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Making %s request to %s",
+                    method,
+                    self.service_name,
+                    extra={
+                        "service": self.service_name,
+                        "method": method,
+                        "url": url,
+                        "request_id": request_id
+                    }
+                )
             
-            response = await self.session.request(
-                method=method,
-                url=url,
-                json=data,
-                params=params,
-                headers=request_headers
-            )
+            try:
+                await asyncio.wait_for(
+                    self._semaphore.acquire(),
+                    timeout=settings.INTER_SERVICE_POOL_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                raise httpx.PoolTimeout(
+                    f"Too many concurrent requests to {self.service_name}"
+                )
+            
+            try:
+                response = await self._send_with_retry(
+                    method=method,
+                    url=url,
+                    json=data,
+                    params=params,
+                    headers=request_headers
+                )
+            finally:
+                self._semaphore.release()
             
             response.raise_for_status()
-            response_data = response.json()
+            # Single-pass decode straight from the response buffer
+            response_data = orjson.loads(response.content)
             
-            logger.info(
-                f"Successful response from {self.service_name}",
-                extra={
-                    "service": self.service_name,
-                    "status_code": response.status_code,
-                    "request_id": request_id
-                }
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Successful response from %s",
+                    self.service_name,
+                    extra={
+                        "service": self.service_name,
+                        "status_code": response.status_code,
+                        "request_id": request_id
+                    }
+                )
             
             return ServiceResponse(
                 success=True,
@@ -145,7 +194,9 @@ class BaseServiceClient:
             
         except httpx.HTTPStatusError as e:
             logger.error(
-                f"HTTP error from {self.service_name}: {e.response.status_code}",
+                "HTTP error from %s: %s",
+                self.service_name,
+                e.response.status_code,
                 extra={
                     "service": self.service_name,
                     "status_code": e.response.status_code,
@@ -163,7 +214,9 @@ class BaseServiceClient:
             
         except httpx.RequestError as e:
             logger.error(
-                f"Request error to {self.service_name}: {str(e)}",
+                "Request error to %s: %s",
+                self.service_name,
+                e,
                 extra={
                     "service": self.service_name,
                     "request_id": request_id,
@@ -180,7 +233,9 @@ class BaseServiceClient:
         
         except Exception as e:
             logger.error(
-                f"Unexpected error communicating with {self.service_name}: {str(e)}",
+                "Unexpected error communicating with %s: %s",
+                self.service_name,
+                e,
                 extra={
                     "service": self.service_name,
                     "request_id": request_id,
@@ -195,6 +250,33 @@ class BaseServiceClient:
                 request_id=request_id
             )
     
+    async def _send_with_retry(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send request, retrying idempotent calls on transient transport errors.
+        
+        POST requests are only retried when they carry an Idempotency-Key header.
+        """
+        headers = kwargs.get("headers") or {}
+        retryable = method.upper() in IDEMPOTENT_METHODS or "Idempotency-Key" in headers
+        max_retries = settings.INTER_SERVICE_MAX_RETRIES if retryable else 0
+        
+        attempt = 0
+        while True:
+            try:
+                return await self.session.request(method=method, url=url, **kwargs)
+            except RETRYABLE_ERRORS as e:
+                if attempt >= max_retries:
+                    raise
+                delay = random.uniform(0, settings.INTER_SERVICE_RETRY_BACKOFF * 2 ** attempt)
+                logger.warning(
+                    "Transient error calling %s (attempt %d), retrying in %.3fs: %s",
+                    self.service_name,
+                    attempt + 1,
+                    delay,
+                    e
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+    
     async def get(self, endpoint: str, params: Optional[Dict] = None, auth_token: Optional[str] = None) -> ServiceResponse:
         """Make GET request."""
         return await self._make_request("GET", endpoint, params=params, auth_token=auth_token)
@@ -212,75 +294,89 @@ class BaseServiceClient:
         return await self._make_request("DELETE", endpoint, auth_token=auth_token)
 
 
-class UserServiceClient(BaseServiceClient):
-    """Client for communicating with User Service."""
-    
-    def __init__(self):
-        super().__init__("user-service", settings.USER_SERVICE_URL)
-    
-    async def get_user(self, user_id: str, auth_token: str) -> ServiceResponse:
-        """Get user by ID."""
-        return await self.get(f"/api/v1/users/{user_id}", auth_token=auth_token)
-    
-    async def validate_user(self, auth_token: str) -> ServiceResponse:
-        """Validate user token and get user info."""
-        return await self.get("/api/v1/auth/me", auth_token=auth_token)
-    
-    async def check_user_permissions(self, user_id: str, permission: str, auth_token: str) -> ServiceResponse:
-        """Check if user has specific permission."""
-        return await self.get(
-            f"/api/v1/users/{user_id}/permissions/{permission}",
-            auth_token=auth_token
-        )
+# Downstream services this service talks to, keyed by short name
+SERVICES: Dict[str, str] = {
+    "user": settings.USER_SERVICE_URL,
+    "order": settings.ORDER_SERVICE_URL,
+    "inventory": settings.INVENTORY_SERVICE_URL,
+}
 
 
-class OrderServiceClient(BaseServiceClient):
-    """Client for communicating with Order Service."""
-    
-    def __init__(self):
-        super().__init__("order-service", settings.ORDER_SERVICE_URL)
-    
-    async def get_product_orders(self, product_id: str, auth_token: str) -> ServiceResponse:
-        """Get orders containing specific product."""
-        return await self.get(
-            f"/api/v1/orders/by-product/{product_id}",
-            auth_token=auth_token
-        )
-    
-    async def notify_product_updated(self, product_id: str, changes: Dict, auth_token: str) -> ServiceResponse:
-        """Notify order service about product updates."""
-        return await self.post(
-            f"/api/v1/orders/product-updated/{product_id}",
-            data=changes,
-            auth_token=auth_token
-        )
+# User service endpoints
+async def get_user(client: BaseServiceClient, user_id: str, auth_token: str) -> ServiceResponse:
+    """Get user by ID."""
+    return await client.get(f"/api/v1/users/{user_id}", auth_token=auth_token)
 
 
-class InventoryServiceClient(BaseServiceClient):
-    """Client for communicating with Inventory Service."""
-    
-    def __init__(self):
-        super().__init__("inventory-service", settings.INVENTORY_SERVICE_URL)
-    
-    async def get_stock_level(self, product_id: str) -> ServiceResponse:
-        """Get current stock level for product."""
-        return await self.get(f"/api/v1/inventory/{product_id}/stock")
-    
-    async def reserve_stock(self, product_id: str, quantity: int, order_id: str, auth_token: str) -> ServiceResponse:
-        """Reserve stock for an order."""
-        return await self.post(
-            f"/api/v1/inventory/{product_id}/reserve",
-            data={"quantity": quantity, "order_id": order_id},
-            auth_token=auth_token
-        )
-    
-    async def update_stock(self, product_id: str, quantity: int, auth_token: str) -> ServiceResponse:
-        """Update stock level."""
-        return await self.put(
-            f"/api/v1/inventory/{product_id}/stock",
-            data={"quantity": quantity},
-            auth_token=auth_token
-        )
+async def validate_user(client: BaseServiceClient, auth_token: str) -> ServiceResponse:
+    """Validate user token and get user info."""
+    return await client.get("/api/v1/auth/me", auth_token=auth_token)
+
+
+async def check_user_permissions(
+    client: BaseServiceClient,
+    user_id: str,
+    permission: str,
+    auth_token: str
+) -> ServiceResponse:
+    """Check if user has specific permission."""
+    return await client.get(
+        f"/api/v1/users/{user_id}/permissions/{permission}",
+        auth_token=auth_token
+    )
+
+
+# Order service endpoints
+async def get_product_orders(client: BaseServiceClient, product_id: str, auth_token: str) -> ServiceResponse:
+    """Get orders containing specific product."""
+    return await client.get(
+        f"/api/v1/orders/by-product/{product_id}",
+        auth_token=auth_token
+    )
+
+
+async def notify_order_product_updated(
+    client: BaseServiceClient,
+    product_id: str,
+    changes: Dict,
+    auth_token: str
+) -> ServiceResponse:
+    """Notify order service about product updates."""
+    return await client.post(
+        f"/api/v1/orders/product-updated/{product_id}",
+        data=changes,
+        auth_token=auth_token
+    )
+
+
+# Inventory service endpoints
+async def get_stock_level(client: BaseServiceClient, product_id: str) -> ServiceResponse:
+    """Get current stock level for product."""
+    return await client.get(f"/api/v1/inventory/{product_id}/stock")
+
+
+async def reserve_stock(
+    client: BaseServiceClient,
+    product_id: str,
+    quantity: int,
+    order_id: str,
+    auth_token: str
+) -> ServiceResponse:
+    """Reserve stock for an order."""
+    return await client.post(
+        f"/api/v1/inventory/{product_id}/reserve",
+        data={"quantity": quantity, "order_id": order_id},
+        auth_token=auth_token
+    )
+
+
+async def update_stock(client: BaseServiceClient, product_id: str, quantity: int, auth_token: str) -> ServiceResponse:
+    """Update stock level."""
+    return await client.put(
+        f"/api/v1/inventory/{product_id}/stock",
+        data={"quantity": quantity},
+        auth_token=auth_token
+    )
 
 
 class EventPublisher:
@@ -291,21 +387,25 @@ class EventPublisher:
         self.exchange = settings.RABBITMQ_EXCHANGE
         self.connection = None
         self.channel = None
+        self._exchange_declared = False
     
     async def connect(self):
         """Connect to RabbitMQ."""
+        if aio_pika is None:
+            raise RuntimeError("aio_pika is required for event publishing")
+        
         try:
-            import aio_pika
-            
             self.connection = await aio_pika.connect_robust(self.rabbitmq_url)
             self.channel = await self.connection.channel()
             
-            # Declare exchange
+            # Declare exchange once; later reconnects only look it up
             self.exchange_obj = await self.channel.declare_exchange(
                 self.exchange,
-                aio_pika.ExchangeType.TOPIC,
-                durable=True
+                ExchangeType.TOPIC,
+                durable=True,
+                passive=self._exchange_declared
             )
+            self._exchange_declared = True
             
             logger.info("Connected to RabbitMQ for event publishing")
             
@@ -345,9 +445,7 @@ class EventPublisher:
         routing_key = routing_key or f"product.{event_type}"
         
         try:
-            import aio_pika
-            
-            message = aio_pika.Message(
+            message = Message(
                 json.dumps(event.dict()).encode(),
                 headers={
                     "event_type": event_type,
@@ -387,9 +485,10 @@ class InterServiceManager:
     """Manager for all inter-service communications."""
     
     def __init__(self):
-        self.user_client = UserServiceClient()
-        self.order_client = OrderServiceClient()
-        self.inventory_client = InventoryServiceClient()
+        self.clients: Dict[str, BaseServiceClient] = {
+            name: BaseServiceClient(f"{name}-service", url)
+            for name, url in SERVICES.items()
+        }
         self.event_publisher = EventPublisher()
     
     async def initialize(self):
@@ -404,9 +503,9 @@ class InterServiceManager:
     
     async def validate_user_access(self, auth_token: str, required_permission: Optional[str] = None) -> Dict[str, Any]:
         """Validate user and check permissions."""
-        async with self.user_client as client:
+        async with self.clients["user"] as client:
             # Validate user token
-            user_response = await client.validate_user(auth_token)
+            user_response = await validate_user(client, auth_token)
             
             if not user_response.success:
                 raise HTTPException(
@@ -418,7 +517,8 @@ class InterServiceManager:
             
             # Check specific permission if required
             if required_permission:
-                perm_response = await client.check_user_permissions(
+                perm_response = await check_user_permissions(
+                    client,
                     user_data["id"],
                     required_permission,
                     auth_token
@@ -434,8 +534,8 @@ class InterServiceManager:
     
     async def sync_inventory(self, product_id: str, new_stock: int, auth_token: str) -> bool:
         """Synchronize inventory with inventory service."""
-        async with self.inventory_client as client:
-            response = await client.update_stock(product_id, new_stock, auth_token)
+        async with self.clients["inventory"] as client:
+            response = await update_stock(client, product_id, new_stock, auth_token)
             return response.success
     
     async def notify_product_created(self, product_data: Dict[str, Any], correlation_id: Optional[str] = None):
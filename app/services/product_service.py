@@ -4,18 +4,59 @@ This module provides functionality for ProductModel CRUD operations,
 search, filtering, inventory management, and analytics.
 """
 
-from decimal import Decimal
-from typing import Dict, List, Optional, Tuple
-from uuid import UUID
+import asyncio
+import base64
+import hashlib
+import logging
+from collections import Counter
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Type, Union
+from uuid import UUID, uuid4
 
+import orjson
 from fastapi import HTTPException, status
-from sqlalchemy import and_, desc, func, or_, select, update
+from sqlalchemy import (
+    JSON,
+    Float,
+    Integer,
+    Numeric,
+    Update,
+    and_,
+    case,
+    cast,
+    column,
+    delete,
+    desc,
+    exists,
+    false,
+    func,
+    insert,
+    lambda_stmt,
+    literal,
+    or_,
+    select,
+    text,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, aggregate_order_by, insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.types import NullType
 
 from app.models.brand import Brand
 from app.models.category import Category
-from app.models.product import Product as ProductModel, ProductImage, ProductStatus, ProductType
+from app.models.product import (
+    Product as ProductModel,
+    ProductImage,
+    ProductStatus,
+    ProductType,
+    product_categories,
+    product_related,
+    product_stats_view
+)
 from app.schemas.common import PaginationParams, PaginatedResponse
 from app.schemas.product import (
     Product,
@@ -23,9 +64,174 @@ from app.schemas.product import (
     ProductUpdate,
     ProductSearch,
     ProductBulkOperation,
-    ProductStats
+    ProductStats,
+    ProductSummary
 )
-from app.services.cache_service import CacheService
+from app.config import settings
+from app.context import request_memo
+from app.database.connection import get_session_factory
+from app.services.brand_service import BRAND_LIST_CACHE_TAG
+from app.services.cache_service import CacheService, get_cache_service
+from app.services.category_service import CATEGORY_LIST_CACHE_TAG
+
+logger = logging.getLogger(__name__)
+
+# Tag set holding every cached product list; narrower tags share this prefix
+LIST_CACHE_TAG = "products:list_keys"
+
+# Prices are stored as NUMERIC(10, 2)
+PRICE_QUANTUM = Decimal("0.01")
+MAX_PRICE = Decimal("99999999.99")
+
+# Cache key of the serialized featured products list, stored as
+# "<item count>\n<JSON list>" so it is only parsed when it must be sliced
+FEATURED_CACHE_KEY = "featured:products"
+
+# Counters buffered in Redis, named after the flusher that writes them back
+VIEW_COUNT_FLUSHER = "view_counts"
+BRAND_COUNT_FLUSHER = "brand_counts"
+
+# Flushers running in this process; a counter is only buffered in Redis
+# while its flusher is running, otherwise it is written in the transaction
+_running_flushers: Set[str] = set()
+
+# Columns (and SQL-computed fields) of the Product schema read by list
+# queries, so pages are built from plain rows instead of ORM instances
+PRODUCT_LIST_COLUMNS = (
+    ProductModel.id,
+    ProductModel.name,
+    ProductModel.slug,
+    ProductModel.description,
+    ProductModel.short_description,
+    ProductModel.sku,
+    ProductModel.barcode,
+    ProductModel.price,
+    ProductModel.compare_price,
+    ProductModel.cost_price,
+    ProductModel.weight,
+    ProductModel.stock_quantity,
+    ProductModel.track_inventory,
+    ProductModel.allow_backorder,
+    ProductModel.status,
+    ProductModel.is_featured,
+    ProductModel.is_digital,
+    ProductModel.requires_shipping,
+    ProductModel.meta_title,
+    ProductModel.meta_description,
+    ProductModel.meta_keywords,
+    ProductModel.tags,
+    ProductModel.attributes,
+    ProductModel.brand_id,
+    ProductModel.view_count,
+    ProductModel.rating,
+    ProductModel.review_count,
+    ProductModel.sales_count,
+    ProductModel.created_at,
+    ProductModel.updated_at,
+    case(
+        (
+            or_(
+                ProductModel.dimensions_length.isnot(None),
+                ProductModel.dimensions_width.isnot(None),
+                ProductModel.dimensions_height.isnot(None)
+            ),
+            func.jsonb_strip_nulls(
+                func.jsonb_build_object(
+                    "length", ProductModel.dimensions_length,
+                    "width", ProductModel.dimensions_width,
+                    "height", ProductModel.dimensions_height
+                )
+            )
+        )
+    ).label("dimensions"),
+    or_(
+        ProductModel.track_inventory == False,
+        ProductModel.stock_quantity > 0,
+        ProductModel.allow_backorder == True
+    ).label("is_in_stock"),
+    and_(
+        ProductModel.track_inventory == True,
+        ProductModel.stock_quantity <= ProductModel.min_stock_level
+    ).label("is_low_stock"),
+    case(
+        (
+            ProductModel.compare_price > ProductModel.price,
+            func.round(
+                (ProductModel.compare_price - ProductModel.price) / ProductModel.compare_price * 100, 2
+            )
+        )
+    ).label("discount_percentage"),
+    case(
+        (
+            ProductModel.cost_price > 0,
+            func.round((ProductModel.price - ProductModel.cost_price) / ProductModel.price * 100, 2)
+        )
+    ).label("profit_margin"),
+)
+
+
+class ProductLoader:
+    """Batch by-id ProductModel lookups for one service instance.
+    
+    Loads requested in the same event-loop tick are coalesced into a single
+    ``WHERE id IN (...)`` query, and concurrent loads of an ID share one
+    fetch. Batches run one at a time, since they share the service's
+    session; loads arriving while a batch runs are queued for the next one.
+    """
+    
+    def __init__(self, batch_load: Callable[[List[str]], Awaitable[List[Optional[ProductModel]]]]):
+        """Initialize the loader.
+        
+        Args:
+            batch_load: Coroutine function returning products in the order of the given IDs
+        """
+        self._batch_load = batch_load
+        self._futures: Dict[str, asyncio.Future] = {}
+        self._queue: List[str] = []
+        self._dispatch_lock = asyncio.Lock()
+        # The event loop only keeps weak references to tasks
+        self._dispatch_task: Optional[asyncio.Task] = None
+    
+    async def load(self, product_id: str) -> Optional[ProductModel]:
+        """Load a ProductModel by ID as part of the current batch.
+        
+        Args:
+            product_id: ProductModel ID
+            
+        Returns:
+            ProductModel object or None if not found
+        """
+        product_id = str(product_id)
+        future = self._futures.get(product_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._futures[product_id] = future
+            if not self._queue:
+                # The task's first step runs after the current callbacks,
+                # so loads issued in this tick join the same batch
+                self._dispatch_task = loop.create_task(self._dispatch())
+            self._queue.append(product_id)
+        return await future
+    
+    async def _dispatch(self) -> None:
+        """Fetch every queued ID in one query and resolve their futures."""
+        async with self._dispatch_lock:
+            product_ids, self._queue = self._queue, []
+            if not product_ids:
+                # An earlier dispatch waiting on the lock took this batch
+                return
+            
+            try:
+                products = await self._batch_load(product_ids)
+            except Exception as e:
+                for product_id in product_ids:
+                    self._futures.pop(product_id).set_exception(e)
+                return
+            
+            # Resolved futures are dropped so later loads see fresh rows
+            for product_id, product in zip(product_ids, products):
+                self._futures.pop(product_id).set_result(product)
 
 
 class ProductService:
@@ -40,6 +246,7 @@ class ProductService:
         """
         self.db = db_session
         self.cache = cache_service
+        self.loader = ProductLoader(self.get_products_by_ids)
     
     async def create_product(self, product_data: ProductCreate, user_id: str) -> ProductModel:
         """Create a new ProductModel.
@@ -54,24 +261,15 @@ class ProductService:
         Raises:
             HTTPException: If SKU already exists or categories/brand not found
         """
-        # Check if SKU already exists
-        existing_product = await self._get_product_by_sku(product_data.sku)
-        if existing_product:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"ProductModel with SKU '{product_data.sku}' already exists"
-            )
-        
-        # Validate categories exist
-        categories = await self._validate_categories(product_data.category_ids)
-        
-        # Validate brand exists (if provided)
-        brand = None
-        if product_data.brand_id:
-            brand = await self._validate_brand(product_data.brand_id)
+        # Validate categories and brand (if provided) in one query; SKU
+        # uniqueness is enforced by the unique constraint on insert
+        categories, brand = await self._validate_refs(
+            product_data.category_ids, product_data.brand_id
+        )
         
-        # Create product
-        ProductModel = ProductModel(
+        # Create product; the ID is assigned up front rather than on flush
+        product = ProductModel(
+            id=uuid4(),
             name=product_data.name,
             description=product_data.description,
             short_description=product_data.short_description,
@@ -97,66 +295,123 @@ class ProductService:
             meta_keywords=product_data.meta_keywords,
             tags=product_data.tags,
             attributes=product_data.attributes,
+            category_id=product_data.category_ids[0],
             brand_id=product_data.brand_id,
             created_by=user_id
         )
         
-        # Set categories
-        ProductModel.categories = categories
+        # Set relationships from the already-validated objects
+        product.categories = categories
+        product.brand = brand
         
-        self.db.add(ProductModel)
-        await self.db.flush()  # Get ProductModel ID
+        self.db.add(product)
+        await self._flush_checking_sku(product_data.sku)
         
-        # Create ProductModel images
+        # Create ProductModel images in a single multi-row INSERT
         if product_data.images:
-            for img_data in product_data.images:
-                image = ProductImage(
-                    product_id=ProductModel.id,
-                    url=img_data.url,
-                    alt_text=img_data.alt_text,
-                    display_order=img_data.display_order,
-                    is_primary=img_data.is_primary
-                )
-                self.db.add(image)
-        
-        await self.db.commit()
-        await self.db.refresh(ProductModel)
+            await self.db.execute(
+                insert(ProductImage),
+                [
+                    {
+                        "product_id": product.id,
+                        "image_url": img_data.url,
+                        "alt_text": img_data.alt_text,
+                        "sort_order": img_data.display_order,
+                        "is_primary": img_data.is_primary
+                    }
+                    for img_data in product_data.images
+                ]
+            )
         
-        # Load relationships
-        await self.db.refresh(ProductModel, ['categories', 'brand', 'images'])
+        # Update category and brand ProductModel counts in the same transaction
+        deferred_brand_counts = await self._stage_product_counts(
+            dict.fromkeys(product_data.category_ids, 1),
+            {product_data.brand_id: 1} if product_data.brand_id else {}
+        )
         
-        # Update category ProductModel counts
-        await self._update_category_product_counts(product_data.category_ids, increment=True)
+        await self.db.commit()
+        await self._buffer_brand_counts(deferred_brand_counts)
         
-        # Update brand ProductModel count
-        if product_data.brand_id:
-            await self._update_brand_product_count(product_data.brand_id, increment=True)
+        # Categories and brand are already attached; only images need loading
+        await self.db.refresh(product, ['images'])
         
         # Cache product
         if self.cache:
-            await self.cache.set_product(ProductModel)
+            await self.cache.cache_product(
+                str(product.id),
+                self._product_from_model(product).model_dump(mode="json")
+            )
+            await self._invalidate_list_caches(
+                product_data.category_ids,
+                [product_data.brand_id]
+            )
         
         return product
     
-    async def get_product(self, product_id: str, increment_view: bool = True) -> Optional[ProductModel]:
+    async def get_product(
+        self,
+        product_id: str,
+        increment_view: bool = True
+    ) -> Optional[Product]:
         """Get ProductModel by ID.
         
+        A cache hit is served from the cached serialized product without
+        touching the database; views are buffered in Redis either way.
+        
         Args:
             product_id: ProductModel ID
             increment_view: Whether to increment view count
             
         Returns:
-            ProductModel object or None if not found
+            Product schema or None if not found
         """
         # Try cache first
         if self.cache:
-            cached_product = await self.cache.get_product(product_id)
+            cached_product = await self.cache.get_cached_product(product_id)
             if cached_product:
                 if increment_view:
                     await self._increment_view_count(product_id)
-                return cached_product
+                return Product.model_validate(cached_product)
+        
+        product = await self.get_product_orm(product_id)
+        if not product:
+            return None
+        
+        schema = self._product_from_model(product)
+        
+        # Cache product
+        if self.cache:
+            await self.cache.cache_product(product_id, schema.model_dump(mode="json"))
         
-        # Query database
+        # Increment view count
+        if increment_view:
+            await self._increment_view_count(product_id)
+        
+        return schema
+    
+    async def get_product_orm(self, product_id: str) -> Optional[ProductModel]:
+        """Get the ProductModel row by ID, bypassing the cache.
+        
+        For internal callers that need the ORM instance, e.g. to modify it.
+        Concurrent lookups are batched into one query.
+        
+        Args:
+            product_id: ProductModel ID
+            
+        Returns:
+            ProductModel object or None if not found
+        """
+        return await self.loader.load(product_id)
+    
+    async def get_products_by_ids(self, product_ids: List[str]) -> List[Optional[ProductModel]]:
+        """Get several products by ID in one query.
+        
+        Args:
+            product_ids: ProductModel IDs
+            
+        Returns:
+            Products in the order of product_ids, None where not found
+        """
         result = await self.db.execute(
             select(ProductModel)
             .options(
@@ -164,20 +419,10 @@ class ProductService:
                 selectinload(ProductModel.brand),
                 selectinload(ProductModel.images)
             )
-            .where(ProductModel.id == product_id)
+            .where(ProductModel.id.in_(product_ids))
         )
-        ProductModel = result.scalar_one_or_none()
-        
-        if ProductModel:
-            # Cache product
-            if self.cache:
-                await self.cache.set_product(ProductModel)
-            
-            # Increment view count
-            if increment_view:
-                await self._increment_view_count(product_id)
-        
-        return product
+        products = {str(product.id): product for product in result.scalars().all()}
+        return [products.get(str(product_id)) for product_id in product_ids]
     
     async def get_product_by_slug(self, slug: str, increment_view: bool = True) -> Optional[ProductModel]:
         """Get ProductModel by slug.
@@ -190,18 +435,20 @@ class ProductService:
             ProductModel object or None if not found
         """
         result = await self.db.execute(
-            select(ProductModel)
-            .options(
-                selectinload(ProductModel.categories),
-                selectinload(ProductModel.brand),
-                selectinload(ProductModel.images)
+            lambda_stmt(
+                lambda: select(ProductModel)
+                .options(
+                    selectinload(ProductModel.categories),
+                    selectinload(ProductModel.brand),
+                    selectinload(ProductModel.images)
+                )
+                .where(ProductModel.slug == slug)
             )
-            .where(ProductModel.slug == slug)
         )
-        ProductModel = result.scalar_one_or_none()
+        product = result.scalar_one_or_none()
         
-        if ProductModel and increment_view:
-            await self._increment_view_count(str(ProductModel.id))
+        if product and increment_view:
+            await self._increment_view_count(str(product.id))
         
         return product
     
@@ -219,76 +466,69 @@ class ProductService:
         Raises:
             HTTPException: If ProductModel not found or SKU conflict
         """
-        # Get existing product
-        ProductModel = await self.get_product(product_id, increment_view=False)
-        if not ProductModel:
+        # Get existing product; category links are diffed in SQL, not loaded
+        product = await self._get_product_bare(product_id)
+        if not product:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="ProductModel not found"
             )
         
-        # Check SKU conflict if SKU is being updated
-        if product_data.sku and product_data.sku != ProductModel.sku:
-            existing_product = await self._get_product_by_sku(product_data.sku)
-            if existing_product and existing_product.id != ProductModel.id:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"ProductModel with SKU '{product_data.sku}' already exists"
-                )
-        
-        # Validate categories if being updated
-        old_category_ids = [str(cat.id) for cat in ProductModel.categories]
-        new_categories = None
-        if product_data.category_ids is not None:
-            new_categories = await self._validate_categories(product_data.category_ids)
+        # Validate categories/brand in one query; SKU conflicts surface as
+        # unique constraint violations when the update is flushed
+        if product_data.category_ids or product_data.brand_id:
+            await self._validate_refs(product_data.category_ids or [], product_data.brand_id)
         
-        # Validate brand if being updated
-        if product_data.brand_id is not None:
-            if product_data.brand_id:
-                await self._validate_brand(product_data.brand_id)
+        old_brand_ids = [str(product.brand_id)] if product.brand_id else []
         
         # Update ProductModel fields
         update_data = product_data.dict(exclude_unset=True, exclude={'category_ids'})
         update_data['updated_by'] = user_id
         
         for field, value in update_data.items():
-            setattr(ProductModel, field, value)
-        
-        # Update categories if provided
-        if new_categories is not None:
-            ProductModel.categories = new_categories
+            setattr(product, field, value)
         
-        await self.db.commit()
-        await self.db.refresh(ProductModel, ['categories', 'brand', 'images'])
+        # Keep the primary category in line with the category links
+        if product_data.category_ids is not None:
+            product.category_id = product_data.category_ids[0] if product_data.category_ids else None
+        await self._flush_checking_sku(product_data.sku)
         
-        # Update category ProductModel counts
+        # Update category links, then category and brand ProductModel counts
+        # in one statement, all in the same transaction
+        removed_category_ids: Set[str] = set()
+        category_deltas: Dict[str, int] = {}
         if product_data.category_ids is not None:
-            new_category_ids = product_data.category_ids
-            
-            # Decrement old categories
-            removed_categories = set(old_category_ids) - set(new_category_ids)
-            if removed_categories:
-                await self._update_category_product_counts(list(removed_categories), increment=False)
-            
-            # Increment new categories
-            added_categories = set(new_category_ids) - set(old_category_ids)
-            if added_categories:
-                await self._update_category_product_counts(list(added_categories), increment=True)
+            added_category_ids, removed_category_ids = await self._stage_category_links(
+                product.id, product_data.category_ids
+            )
+            category_deltas.update(dict.fromkeys(added_category_ids, 1))
+            category_deltas.update(dict.fromkeys(removed_category_ids, -1))
         
-        # Update brand ProductModel count
+        # Move the brand ProductModel count if the brand changed
+        brand_deltas: Dict[str, int] = {}
         if product_data.brand_id is not None:
-            old_brand_id = str(ProductModel.brand_id) if ProductModel.brand_id else None
-            new_brand_id = product_data.brand_id
+            old_brand_id = old_brand_ids[0] if old_brand_ids else None
+            new_brand_id = product_data.brand_id or None
             
             if old_brand_id != new_brand_id:
                 if old_brand_id:
-                    await self._update_brand_product_count(old_brand_id, increment=False)
+                    brand_deltas[old_brand_id] = -1
                 if new_brand_id:
-                    await self._update_brand_product_count(new_brand_id, increment=True)
+                    brand_deltas[new_brand_id] = 1
+        
+        deferred_brand_counts = await self._stage_product_counts(category_deltas, brand_deltas)
+        
+        await self.db.commit()
+        await self._buffer_brand_counts(deferred_brand_counts)
+        await self.db.refresh(product, ['categories', 'brand', 'images'])
         
         # Clear cache
         if self.cache:
-            await self.cache.delete_product(product_id)
+            await self.cache.invalidate_product_cache(product_id)
+            await self._invalidate_list_caches(
+                list(removed_category_ids) + [str(cat.id) for cat in product.categories],
+                old_brand_ids + ([str(product.brand_id)] if product.brand_id else [])
+            )
         
         return product
     
@@ -301,32 +541,40 @@ class ProductService:
         Raises:
             HTTPException: If ProductModel not found
         """
-        ProductModel = await self.get_product(product_id, increment_view=False)
-        if not ProductModel:
+        result = await self.db.execute(
+            select(ProductModel.id, ProductModel.brand_id).where(ProductModel.id == product_id)
+        )
+        row = result.one_or_none()
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="ProductModel not found"
             )
         
         # Get category and brand IDs for count updates
-        category_ids = [str(cat.id) for cat in ProductModel.categories]
-        brand_id = str(ProductModel.brand_id) if ProductModel.brand_id else None
+        result = await self.db.execute(
+            select(product_categories.c.category_id)
+            .where(product_categories.c.product_id == product_id)
+        )
+        category_ids = [str(category_id) for category_id in result.scalars().all()]
+        brand_id = str(row.brand_id) if row.brand_id else None
         
-        # Delete ProductModel (cascade will handle images)
-        await self.db.delete(ProductModel)
-        await self.db.commit()
+        # Delete ProductModel (FK cascades handle images and category links)
+        await self.db.execute(delete(ProductModel).where(ProductModel.id == product_id))
         
-        # Update category ProductModel counts
-        if category_ids:
-            await self._update_category_product_counts(category_ids, increment=False)
+        # Update category and brand ProductModel counts in the same transaction
+        deferred_brand_counts = await self._stage_product_counts(
+            dict.fromkeys(category_ids, -1),
+            {brand_id: -1} if brand_id else {}
+        )
         
-        # Update brand ProductModel count
-        if brand_id:
-            await self._update_brand_product_count(brand_id, increment=False)
+        await self.db.commit()
+        await self._buffer_brand_counts(deferred_brand_counts)
         
         # Clear cache
         if self.cache:
-            await self.cache.delete_product(product_id)
+            await self.cache.invalidate_product_cache(product_id)
+            await self._invalidate_list_caches(category_ids, [brand_id])
     
     async def search_products(
         self,
@@ -335,33 +583,57 @@ class ProductService:
     ) -> PaginatedResponse[Product]:
         """Search products with filters and pagination.
         
+        With a cursor (the next_cursor of a previous page) results are
+        paged by keyset instead of OFFSET and no total is computed.
+        
         Args:
             search_params: Search and filter parameters
             pagination: Pagination parameters
             
         Returns:
             Paginated response with products
+            
+        Raises:
+            HTTPException: If the cursor is invalid
         """
-        # Build base query
-        query = select(ProductModel).options(
-            selectinload(ProductModel.categories),
-            selectinload(ProductModel.brand),
-            selectinload(ProductModel.images)
-        )
+        cursor = getattr(pagination, "cursor", None)
+        
+        # Try cache first
+        cache_key = None
+        if self.cache:
+            signature = hashlib.sha1(search_params.model_dump_json().encode()).hexdigest()
+            cache_key = f"search:{signature}:{pagination.page}:{pagination.size}:{cursor or ''}"
+            cached = await self.cache.get_cached_product_list(cache_key)
+            if cached:
+                return self._search_response(
+                    cached["items"], pagination, cached["total"], cached["next_cursor"]
+                )
+        
+        # Build base query over plain columns; in page mode the windowed
+        # count returns the total alongside the page
+        query = select(*PRODUCT_LIST_COLUMNS)
+        if not cursor:
+            query = query.add_columns(func.count().over().label("total"))
         
         # Apply filters
         conditions = []
         
-        # Text search
+        # Text search against the GIN-indexed search vector, plus SKU
+        # substrings through the trigram index
+        ts_query = None
         if search_params.query:
-            search_term = f"%{search_params.query}%"
+            ts_query = func.websearch_to_tsquery("simple", search_params.query)
+            sku_pattern = (
+                search_params.query
+                .replace("\\", "\\\\")
+                .replace("%", "\\%")
+                .replace("_", "\\_")
+            )
             conditions.append(
                 or_(
-                    ProductModel.name.ilike(search_term),
-                    ProductModel.description.ilike(search_term),
-                    ProductModel.short_description.ilike(search_term),
-                    ProductModel.sku.ilike(search_term),
-                    ProductModel.tags.contains([search_params.query.lower()])
+                    ProductModel.search_vec.op("@@")(ts_query),
+                    ProductModel.tags.contains([search_params.query.lower()]),
+                    ProductModel.sku.ilike(f"%{sku_pattern}%", escape="\\")
                 )
             )
         
@@ -391,70 +663,360 @@ class ProductService:
         if search_params.status:
             conditions.append(ProductModel.status == search_params.status)
         
-        # Tags filter
+        # Tags filter (single @> probe on the GIN index)
         if search_params.tags:
-            for tag in search_params.tags:
-                conditions.append(ProductModel.tags.contains([tag.lower()]))
+            conditions.append(ProductModel.tags.contains(search_params.tags))
         
-        # Attributes filter
+        # Attributes filter (single @> probe on the GIN index)
         if search_params.attributes:
-            for key, value in search_params.attributes.items():
-                conditions.append(ProductModel.attributes[key].astext == value)
+            conditions.append(ProductModel.attributes.contains(search_params.attributes))
+        
+        # Apply sorting; the id tie-breaker keeps pages stable
+        if search_params.sort_by == "relevance" and ts_query is not None:
+            sort_column = func.ts_rank_cd(ProductModel.search_vec, ts_query)
+        else:
+            sort_column = getattr(ProductModel, search_params.sort_by, ProductModel.created_at)
+        descending = search_params.sort_order == "desc"
+        
+        # Keyset pagination: seek past the last row of the previous page
+        if cursor:
+            last_sort_value, last_id = self._decode_cursor(cursor)
+            sort_type = Float() if isinstance(sort_column.type, NullType) else sort_column.type
+            last_key = tuple_(cast(literal(last_sort_value), sort_type), literal(last_id, PG_UUID(as_uuid=True)))
+            position = tuple_(sort_column, ProductModel.id)
+            conditions.append(position < last_key if descending else position > last_key)
         
         # Apply conditions
         if conditions:
             query = query.where(and_(*conditions))
         
-        # Apply sorting
-        sort_column = getattr(ProductModel, search_params.sort_by, ProductModel.created_at)
-        if search_params.sort_order == "desc":
-            query = query.order_by(desc(sort_column))
+        sort_key = sort_column.label("sort_key")
+        query = query.add_columns(sort_key)
+        if descending:
+            query = query.order_by(desc(sort_key), desc(ProductModel.id))
+        else:
+            query = query.order_by(sort_key, ProductModel.id)
+        
+        # Apply pagination; in cursor mode one extra row tells if more follow
+        if cursor:
+            query = query.limit(pagination.limit + 1)
+        else:
+            query = query.offset(pagination.offset).limit(pagination.limit)
+        
+        # Aggregate images and category links onto the page rows in SQL so
+        # the page is read in one round-trip
+        page = query.subquery()
+        if descending:
+            page_order = (desc(page.c.sort_key), desc(page.c.id))
         else:
-            query = query.order_by(sort_column)
-        
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar()
-        
-        # Apply pagination
-        query = query.offset(pagination.skip).limit(pagination.limit)
-        
-        # Execute query
-        result = await self.db.execute(query)
-        products = result.scalars().all()
-        
-        return PaginatedResponse(
-            items=list(products),
-            total=total,
-            page=pagination.page,
-            size=pagination.size,
-            pages=pagination.get_total_pages(total)
+            page_order = (page.c.sort_key, page.c.id)
+        result = await self.db.execute(
+            select(page, *self._product_relation_columns(page.c.id)).order_by(*page_order)
         )
+        rows = result.all()
+        
+        total = None
+        next_cursor = None
+        if cursor:
+            if len(rows) > pagination.limit:
+                rows = rows[:pagination.limit]
+                next_cursor = self._encode_cursor(rows[-1].sort_key, rows[-1].id)
+        else:
+            total = rows[0].total if rows else 0
+            
+            # A page past the end carries no window count; count separately only then
+            if not rows and pagination.offset > 0:
+                total = await self.db.scalar(
+                    select(func.count(ProductModel.id)).where(*conditions)
+                )
+            
+            # Offer a cursor for continuing past this page by keyset
+            if rows and pagination.offset + len(rows) < total:
+                next_cursor = self._encode_cursor(rows[-1].sort_key, rows[-1].id)
+        products = [self._product_from_row(row) for row in rows]
+        
+        # Cache results, tagged so writes only invalidate the affected slice
+        if cache_key:
+            await self.cache.cache_tagged_list(
+                cache_key,
+                {
+                    "items": [p.model_dump(mode="json") for p in products],
+                    "total": total,
+                    "next_cursor": next_cursor
+                },
+                self._search_cache_tags(search_params),
+                ttl=settings.LIST_CACHE_TTL_SECONDS
+            )
+        
+        return self._search_response(products, pagination, total, next_cursor)
     
-    async def get_featured_products(self, limit: int = 10) -> List[ProductModel]:
-        """Get featured products.
+    @staticmethod
+    def _product_relation_columns(product_id: Any) -> Tuple[Any, Any]:
+        """Build per-row aggregates of a product's images and category IDs.
+        
+        Args:
+            product_id: Product ID column the subqueries correlate on
+            
+        Returns:
+            Tuple of (images JSON array, category ID array) columns
+        """
+        images = (
+            select(
+                func.json_agg(
+                    aggregate_order_by(
+                        func.json_build_object(
+                            "id", ProductImage.id,
+                            "product_id", ProductImage.product_id,
+                            "url", ProductImage.image_url,
+                            "alt_text", ProductImage.alt_text,
+                            "display_order", ProductImage.sort_order,
+                            "is_primary", ProductImage.is_primary,
+                            "created_at", ProductImage.created_at,
+                            "updated_at", ProductImage.updated_at
+                        ),
+                        ProductImage.sort_order
+                    ),
+                    type_=JSON
+                )
+            )
+            .where(ProductImage.product_id == product_id)
+            .scalar_subquery()
+            .label("images")
+        )
+        category_ids = (
+            select(func.array_agg(product_categories.c.category_id))
+            .where(product_categories.c.product_id == product_id)
+            .scalar_subquery()
+            .label("category_ids")
+        )
+        return images, category_ids
+    
+    @staticmethod
+    def _product_from_row(row: Any) -> Product:
+        """Build a Product schema from a PRODUCT_LIST_COLUMNS row.
+        
+        Args:
+            row: Row with PRODUCT_LIST_COLUMNS and _product_relation_columns
+            
+        Returns:
+            Product schema
+        """
+        data = {column.key: row._mapping[column.key] for column in PRODUCT_LIST_COLUMNS}
+        return ProductService._validate_product(data, row.images or [], row.category_ids or [])
+    
+    @staticmethod
+    def _product_from_model(product: ProductModel) -> Product:
+        """Build a Product schema from a ProductModel with loaded relationships.
+        
+        Args:
+            product: ProductModel with categories and images loaded
+            
+        Returns:
+            Product schema
+        """
+        data = {column.key: getattr(product, column.key) for column in PRODUCT_LIST_COLUMNS}
+        # Match the SQL-built dimensions, which omit unset sizes and weight
+        data["dimensions"] = {
+            name: value
+            for name, value in (
+                ("length", product.dimensions_length),
+                ("width", product.dimensions_width),
+                ("height", product.dimensions_height)
+            )
+            if value is not None
+        } or None
+        images = [
+            {
+                "id": str(image.id),
+                "product_id": str(image.product_id),
+                "url": image.image_url,
+                "alt_text": image.alt_text,
+                "display_order": image.sort_order,
+                "is_primary": image.is_primary,
+                "created_at": image.created_at,
+                "updated_at": image.updated_at
+            }
+            for image in sorted(product.images, key=lambda image: image.sort_order)
+        ]
+        category_ids = [category.id for category in product.categories]
+        return ProductService._validate_product(data, images, category_ids)
+    
+    @staticmethod
+    def _validate_product(
+        data: Dict[str, Any],
+        images: List[Dict[str, Any]],
+        category_ids: List[Any]
+    ) -> Product:
+        """Validate a Product schema from its column values and relations.
+        
+        Args:
+            data: Values keyed by PRODUCT_LIST_COLUMNS keys
+            images: Images already shaped like the ProductImage schema
+            category_ids: Linked category IDs
+            
+        Returns:
+            Product schema
+        """
+        data.update(
+            id=str(data["id"]),
+            brand_id=str(data["brand_id"]) if data["brand_id"] else None,
+            tags=data["tags"] or [],
+            attributes=data["attributes"] or {},
+            category_ids=[str(category_id) for category_id in category_ids],
+            images=images,
+            primary_image=next(
+                (image for image in images if image["is_primary"]),
+                images[0] if images else None
+            )
+        )
+        return Product.model_validate(data)
+    
+    def _search_response(
+        self,
+        items: List[Any],
+        pagination: PaginationParams,
+        total: Optional[int],
+        next_cursor: Optional[str]
+    ) -> PaginatedResponse[Product]:
+        """Build a search response for page or cursor mode.
+        
+        Args:
+            items: Products on the page
+            pagination: Pagination parameters
+            total: Total matching products (None in cursor mode)
+            next_cursor: Cursor for the following page, if any
+            
+        Returns:
+            Paginated response with products
+        """
+        if total is None:
+            return PaginatedResponse.create_from_cursor(items, pagination.size, next_cursor)
+        return PaginatedResponse.create(
+            items, pagination.page, pagination.size, total, next_cursor=next_cursor
+        )
+    
+    @staticmethod
+    def _encode_cursor(sort_value: Any, product_id: UUID) -> str:
+        """Encode the last row of a page as an opaque keyset cursor.
+        
+        Args:
+            sort_value: Value of the sort column
+            product_id: ProductModel ID (tie-breaker)
+            
+        Returns:
+            URL-safe cursor string
+        """
+        payload = orjson.dumps([sort_value, str(product_id)], default=str)
+        return base64.urlsafe_b64encode(payload).decode()
+    
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[Any, UUID]:
+        """Decode a keyset cursor produced by _encode_cursor.
+        
+        Args:
+            cursor: Cursor string
+            
+        Returns:
+            Tuple of (sort value, ProductModel ID)
+            
+        Raises:
+            HTTPException: If the cursor is malformed
+        """
+        try:
+            sort_value, product_id = orjson.loads(base64.urlsafe_b64decode(cursor))
+            return sort_value, UUID(product_id)
+        except (ValueError, TypeError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor"
+            )
+    
+    async def get_featured_products(self, limit: int = 10) -> bytes:
+        """Get featured products as a serialized JSON payload.
+        
+        The longest featured list (FEATURED_PRODUCTS_MAX) is cached once as
+        serialized JSON along with its length, and is only parsed when it
+        holds more than limit items. On a miss only one caller rebuilds it
+        while the others wait for the cache to fill.
         
         Args:
             limit: Maximum number of products to return
             
         Returns:
-            List of featured products
+            JSON-encoded list of featured product summaries
         """
-        # Try cache first
-        if self.cache:
-            cached_products = await self.cache.get_featured_products()
-            if cached_products:
-                return cached_products[:limit]
+        if not self.cache:
+            count, payload = await self._query_featured_payload()
+        else:
+            entry = await self.cache.get_raw(FEATURED_CACHE_KEY)
+            if entry:
+                count, payload = self._split_featured_entry(entry)
+            else:
+                count, payload = await self._fill_featured_cache()
+        
+        if count > limit:
+            return orjson.dumps(orjson.loads(payload)[:limit])
+        return payload
+    
+    async def _fill_featured_cache(self) -> Tuple[int, bytes]:
+        """Rebuild the featured products cache, guarding against stampedes.
+        
+        Returns:
+            Tuple of (item count, JSON-encoded list of featured product summaries)
+        """
+        if await self.cache.acquire_lock(FEATURED_CACHE_KEY, settings.FEATURED_CACHE_LOCK_MS):
+            try:
+                count, payload = await self._query_featured_payload()
+                # Any product write invalidates the unscoped tag
+                await self.cache.cache_tagged_list(
+                    FEATURED_CACHE_KEY,
+                    b"%d\n%s" % (count, payload),
+                    [LIST_CACHE_TAG, f"{LIST_CACHE_TAG}:unscoped"],
+                    ttl=settings.FEATURED_CACHE_TTL_SECONDS
+                )
+                return count, payload
+            finally:
+                await self.cache.release_lock(FEATURED_CACHE_KEY)
+        
+        # Another caller is rebuilding; wait for it up to the lock expiry
+        for _ in range(settings.FEATURED_CACHE_LOCK_MS // 50):
+            await asyncio.sleep(0.05)
+            entry = await self.cache.get_raw(FEATURED_CACHE_KEY)
+            if entry:
+                return self._split_featured_entry(entry)
+        
+        return await self._query_featured_payload()
+    
+    @staticmethod
+    def _split_featured_entry(entry: str) -> Tuple[int, bytes]:
+        """Split a cached featured products entry into its count and payload.
+        
+        Args:
+            entry: Cached "<item count>\n<JSON list>" value
+            
+        Returns:
+            Tuple of (item count, JSON-encoded list of featured product summaries)
+        """
+        count, _, payload = entry.partition("\n")
+        return int(count), payload.encode()
+    
+    async def _query_featured_payload(self) -> Tuple[int, bytes]:
+        """Query and serialize the longest featured products list.
         
-        # Query database
+        Returns:
+            Tuple of (item count, JSON-encoded list of featured product summaries)
+        """
+        # Summaries only need the primary image URL, picked per row in SQL
+        primary_image = (
+            select(ProductImage.image_url)
+            .where(ProductImage.product_id == ProductModel.id)
+            .order_by(desc(ProductImage.is_primary), ProductImage.sort_order)
+            .limit(1)
+            .scalar_subquery()
+            .label("primary_image")
+        )
         result = await self.db.execute(
-            select(ProductModel)
-            .options(
-                selectinload(ProductModel.categories),
-                selectinload(ProductModel.brand),
-                selectinload(ProductModel.images)
-            )
+            select(*PRODUCT_LIST_COLUMNS, primary_image)
             .where(
                 and_(
                     ProductModel.is_featured == True,
@@ -462,19 +1024,21 @@ class ProductService:
                 )
             )
             .order_by(desc(ProductModel.rating), desc(ProductModel.created_at))
-            .limit(limit)
+            .limit(settings.FEATURED_PRODUCTS_MAX)
         )
-        products = result.scalars().all()
-        
-        # Cache products
-        if self.cache and products:
-            await self.cache.set_featured_products(list(products))
-        
-        return list(products)
+        items = [
+            ProductSummary.model_validate({**row._mapping, "id": str(row.id)}).model_dump(mode="json")
+            for row in result
+        ]
+        return len(items), orjson.dumps(items)
     
     async def get_related_products(self, product_id: str, limit: int = 5) -> List[ProductModel]:
         """Get products related to a given ProductModel.
         
+        Products sharing the most categories come first (precomputed in the
+        product_related materialized view). Products without categories, or
+        not yet in the view, fall back to products of the same brand.
+        
         Args:
             product_id: ProductModel ID
             limit: Maximum number of related products
@@ -482,28 +1046,45 @@ class ProductService:
         Returns:
             List of related products
         """
-        ProductModel = await self.get_product(product_id, increment_view=False)
-        if not ProductModel:
-            return []
-        
-        # Get products from same categories or brand
-        category_ids = [str(cat.id) for cat in ProductModel.categories]
+        load_options = (
+            selectinload(ProductModel.categories),
+            selectinload(ProductModel.brand),
+            selectinload(ProductModel.images)
+        )
         
-        conditions = [ProductModel.id != product_id, ProductModel.status == ProductStatus.ACTIVE]
+        result = await self.db.execute(
+            select(ProductModel)
+            .options(*load_options)
+            .join(product_related, product_related.c.related_id == ProductModel.id)
+            .where(
+                and_(
+                    product_related.c.product_id == product_id,
+                    ProductModel.status == ProductStatus.ACTIVE
+                )
+            )
+            .order_by(desc(product_related.c.shared), desc(ProductModel.rating))
+            .limit(limit)
+        )
+        related = list(result.scalars().all())
+        if related:
+            return related
         
-        if category_ids:
-            conditions.append(ProductModel.categories.any(Category.id.in_(category_ids)))
-        elif ProductModel.brand_id:
-            conditions.append(ProductModel.brand_id == ProductModel.brand_id)
+        brand_id = await self.db.scalar(
+            select(ProductModel.brand_id).where(ProductModel.id == product_id)
+        )
+        if not brand_id:
+            return []
         
         result = await self.db.execute(
             select(ProductModel)
-            .options(
-                selectinload(ProductModel.categories),
-                selectinload(ProductModel.brand),
-                selectinload(ProductModel.images)
+            .options(*load_options)
+            .where(
+                and_(
+                    ProductModel.id != product_id,
+                    ProductModel.brand_id == brand_id,
+                    ProductModel.status == ProductStatus.ACTIVE
+                )
             )
-            .where(and_(*conditions))
             .order_by(desc(ProductModel.rating), desc(ProductModel.view_count))
             .limit(limit)
         )
@@ -524,13 +1105,6 @@ class ProductService:
         Raises:
             HTTPException: If ProductModel not found or invalid operation
         """
-        ProductModel = await self.get_product(product_id, increment_view=False)
-        if not ProductModel:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="ProductModel not found"
-            )
-        
         if operation == "set":
             new_quantity = quantity
         elif operation == "add":
@@ -543,24 +1117,46 @@ class ProductService:
                 detail="Invalid operation. Use 'set', 'add', or 'subtract'"
             )
         
-        if new_quantity < 0:
+        # Compute the new quantity in the UPDATE itself so concurrent
+        # adjustments cannot race, and get the updated row back in one trip
+        result = await self.db.execute(
+            update(ProductModel)
+            .where(and_(ProductModel.id == product_id, new_quantity >= 0))
+            .values(stock_quantity=new_quantity)
+            .returning(ProductModel)
+            .execution_options(populate_existing=True)
+        )
+        product = result.scalar_one_or_none()
+        
+        if not product:
+            await self.db.rollback()
+            if not await self.db.scalar(select(exists().where(ProductModel.id == product_id))):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="ProductModel not found"
+                )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Stock quantity cannot be negative"
             )
         
-        await self.db.execute(
-            update(ProductModel)
-            .where(ProductModel.id == product_id)
-            .values(stock_quantity=new_quantity)
-        )
         await self.db.commit()
         
-        # Clear cache
+        # Clear cache; stock changes can move the product in or out of
+        # in-stock filtered lists
         if self.cache:
-            await self.cache.delete_product(product_id)
+            await self.cache.invalidate_product_cache(product_id)
+            category_ids = (await self.db.scalars(
+                select(product_categories.c.category_id)
+                .where(product_categories.c.product_id == product_id)
+            )).all()
+            await self._invalidate_list_caches(
+                [str(category_id) for category_id in category_ids],
+                [str(product.brand_id)] if product.brand_id else [],
+                counts_changed=False
+            )
         
-        return await self.get_product(product_id, increment_view=False)
+        return product
     
     async def bulk_operation(self, operation_data: ProductBulkOperation) -> Dict[str, int]:
         """Perform bulk operations on products.
@@ -575,86 +1171,79 @@ class ProductService:
         product_ids = operation_data.product_ids
         data = operation_data.data or {}
         
-        # Verify products exist
-        result = await self.db.execute(
-            select(func.count()).where(ProductModel.id.in_(product_ids))
-        )
-        existing_count = result.scalar()
+        # Build operation; RETURNING tells us which products actually exist
+        category_counts: Dict[str, int] = {}
+        if operation == "delete":
+            # Category links go with the FK cascade, so count them beforehand
+            result = await self.db.execute(
+                select(product_categories.c.category_id, func.count())
+                .where(product_categories.c.product_id.in_(product_ids))
+                .group_by(product_categories.c.category_id)
+            )
+            category_counts = {str(category_id): count for category_id, count in result.all()}
+            
+            stmt = ProductModel.__table__.delete().where(ProductModel.id.in_(product_ids))
+        elif operation == "update_price" and data.get("prices"):
+            stmt = self._build_price_update(product_ids, data["prices"])
+        else:
+            if operation == "activate":
+                update_values = {"status": ProductStatus.ACTIVE}
+            elif operation == "deactivate":
+                update_values = {"status": ProductStatus.INACTIVE}
+            elif operation == "feature":
+                update_values = {"is_featured": True}
+            elif operation == "unfeature":
+                update_values = {"is_featured": False}
+            elif operation == "update_stock":
+                stock_quantity = data.get("stock_quantity")
+                if stock_quantity is None:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="stock_quantity required for update_stock operation"
+                    )
+                update_values = {"stock_quantity": stock_quantity}
+            elif operation == "update_price":
+                price = data.get("price")
+                if price is None:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="price or prices required for update_price operation"
+                    )
+                update_values = {"price": price}
+            
+            stmt = update(ProductModel).where(ProductModel.id.in_(product_ids)).values(**update_values)
+        
+        result = await self.db.execute(stmt.returning(ProductModel.id, ProductModel.brand_id))
+        affected_rows = result.all()
+        affected_ids = {str(row.id) for row in affected_rows}
         
-        if existing_count != len(product_ids):
+        missing_ids = set(product_ids) - affected_ids
+        if missing_ids:
+            await self.db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Some products not found"
+                detail=f"Products not found: {', '.join(sorted(missing_ids))}"
             )
         
-        # Perform operation
-        if operation == "activate":
-            await self.db.execute(
-                update(ProductModel)
-                .where(ProductModel.id.in_(product_ids))
-                .values(status=ProductStatus.ACTIVE)
-            )
-        elif operation == "deactivate":
-            await self.db.execute(
-                update(ProductModel)
-                .where(ProductModel.id.in_(product_ids))
-                .values(status=ProductStatus.INACTIVE)
-            )
-        elif operation == "feature":
-            await self.db.execute(
-                update(ProductModel)
-                .where(ProductModel.id.in_(product_ids))
-                .values(is_featured=True)
-            )
-        elif operation == "unfeature":
-            await self.db.execute(
-                update(ProductModel)
-                .where(ProductModel.id.in_(product_ids))
-                .values(is_featured=False)
-            )
-        elif operation == "update_stock":
-            stock_quantity = data.get("stock_quantity")
-            if stock_quantity is None:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="stock_quantity required for update_stock operation"
-                )
-            await self.db.execute(
-                update(ProductModel)
-                .where(ProductModel.id.in_(product_ids))
-                .values(stock_quantity=stock_quantity)
-            )
-        elif operation == "update_price":
-            price = data.get("price")
-            if price is None:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="price required for update_price operation"
-                )
-            await self.db.execute(
-                update(ProductModel)
-                .where(ProductModel.id.in_(product_ids))
-                .values(price=price)
-            )
-        elif operation == "delete":
-            # Get category and brand info before deletion
-            products_info = await self.db.execute(
-                select(ProductModel.id, ProductModel.brand_id)
-                .options(selectinload(ProductModel.categories))
-                .where(ProductModel.id.in_(product_ids))
-            )
-            
-            # Delete products
-            await self.db.execute(
-                ProductModel.__table__.delete().where(ProductModel.id.in_(product_ids))
+        # Decrement category and brand counts for deleted products
+        deferred_brand_counts: Dict[str, int] = {}
+        if operation == "delete":
+            brand_counts = Counter(str(row.brand_id) for row in affected_rows if row.brand_id)
+            deferred_brand_counts = await self._stage_product_counts(
+                {category_id: -count for category_id, count in category_counts.items()},
+                {brand_id: -count for brand_id, count in brand_counts.items()}
             )
         
         await self.db.commit()
+        await self._buffer_brand_counts(deferred_brand_counts)
         
-        # Clear cache for affected products
+        # Clear cache for affected products and every cached list
         if self.cache:
-            for product_id in product_ids:
-                await self.cache.delete_product(product_id)
+            await self.cache.delete_products(product_ids)
+            await self.cache.invalidate_list_keys(
+                LIST_CACHE_TAG,
+                *([CATEGORY_LIST_CACHE_TAG] if operation == "delete" else [])
+            )
         
         return {
             "operation": operation,
@@ -662,6 +1251,56 @@ class ProductService:
             "success": True
         }
     
+    def _build_price_update(self, product_ids: List[str], prices: Dict[str, Any]) -> Update:
+        """Build one UPDATE setting a different price per product.
+        
+        Args:
+            product_ids: IDs of the products to reprice
+            prices: Mapping of ProductModel ID to its new price
+            
+        Returns:
+            UPDATE ... FROM (VALUES ...) statement
+            
+        Raises:
+            HTTPException: If prices do not match product_ids or are invalid
+        """
+        if set(prices) != set(product_ids):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="prices must have exactly one entry per product ID"
+            )
+        
+        try:
+            rows = [
+                (UUID(product_id), Decimal(str(price)).quantize(PRICE_QUANTUM, rounding=ROUND_HALF_UP))
+                for product_id, price in prices.items()
+            ]
+        except (ValueError, ArithmeticError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="prices must map valid product IDs to numeric prices"
+            )
+        
+        # Prices must be positive, like the schema's price field, and fit the
+        # column; checked here so bad values fail validation, not the UPDATE
+        if not all(0 < price <= MAX_PRICE for _, price in rows):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"prices must be greater than 0 and at most {MAX_PRICE}"
+            )
+        
+        new_prices = values(
+            column("id", PG_UUID(as_uuid=True)),
+            column("price", Numeric(10, 2)),
+            name="new_prices"
+        ).data(rows)
+        
+        return (
+            update(ProductModel)
+            .where(ProductModel.id == new_prices.c.id)
+            .values(price=new_prices.c.price)
+        )
+    
     async def get_product_stats(self, product_id: str) -> ProductStats:
         """Get ProductModel statistics.
         
@@ -674,111 +1313,179 @@ class ProductService:
         Raises:
             HTTPException: If ProductModel not found
         """
-        ProductModel = await self.get_product(product_id, increment_view=False)
-        if not ProductModel:
+        # Derived metrics are computed by the product_stats_view in SQL
+        result = await self.db.execute(
+            select(product_stats_view).where(product_stats_view.c.id == product_id)
+        )
+        row = result.one_or_none()
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="ProductModel not found"
             )
         
-        # Calculate derived metrics
-        revenue = ProductModel.price * ProductModel.sales_count
-        profit = None
-        profit_margin = None
-        
-        if ProductModel.cost_price:
-            profit = (ProductModel.price - ProductModel.cost_price) * ProductModel.sales_count
-            profit_margin = ((ProductModel.price - ProductModel.cost_price) / ProductModel.price) * 100
-        
-        conversion_rate = 0.0
-        if ProductModel.view_count > 0:
-            conversion_rate = (ProductModel.sales_count / ProductModel.view_count) * 100
-        
-        return ProductStats(
-            id=str(ProductModel.id),
-            name=ProductModel.name,
-            view_count=ProductModel.view_count,
-            sales_count=ProductModel.sales_count,
-            revenue=revenue,
-            rating=ProductModel.rating,
-            review_count=ProductModel.review_count,
-            conversion_rate=conversion_rate,
-            profit=profit,
-            profit_margin=profit_margin
+        return ProductStats(**{**row._mapping, "id": str(row.id)})
+    
+    async def get_products_stats(self, product_ids: List[str]) -> List[ProductStats]:
+        """Get statistics for several products in one query.
+        
+        Args:
+            product_ids: ProductModel IDs
+            
+        Returns:
+            Statistics in the order of product_ids; unknown IDs are skipped
+        """
+        result = await self.db.execute(
+            select(product_stats_view).where(product_stats_view.c.id.in_(product_ids))
         )
+        stats = {
+            str(row.id): ProductStats(**{**row._mapping, "id": str(row.id)})
+            for row in result
+        }
+        return [stats[product_id] for product_id in map(str, product_ids) if product_id in stats]
     
-    async def _get_product_by_sku(self, sku: str) -> Optional[ProductModel]:
-        """Get ProductModel by SKU.
+    async def _get_product_bare(self, product_id: str) -> Optional[ProductModel]:
+        """Get ProductModel by ID without loading relationships or using the cache.
         
         Args:
-            sku: ProductModel SKU
+            product_id: ProductModel ID
             
         Returns:
             ProductModel object or None if not found
         """
         result = await self.db.execute(
-            select(ProductModel).where(ProductModel.sku == sku.upper())
+            lambda_stmt(lambda: select(ProductModel).where(ProductModel.id == product_id))
         )
         return result.scalar_one_or_none()
     
-    async def _validate_categories(self, category_ids: List[str]) -> List[Category]:
-        """Validate that categories exist.
+    def _search_cache_tags(self, search_params: ProductSearch) -> List[str]:
+        """Get invalidation tags for a cached search result.
         
         Args:
-            category_ids: List of category IDs
+            search_params: Search and filter parameters of the result
             
         Returns:
-            List of category objects
-            
-        Raises:
-            HTTPException: If any category not found
+            List of tag set names
         """
-        result = await self.db.execute(
-            select(Category).where(Category.id.in_(category_ids))
-        )
-        categories = result.scalars().all()
+        if search_params.category_ids:
+            scope = [f"{LIST_CACHE_TAG}:category:{cid}" for cid in search_params.category_ids]
+        elif search_params.brand_ids:
+            scope = [f"{LIST_CACHE_TAG}:brand:{bid}" for bid in search_params.brand_ids]
+        else:
+            scope = [f"{LIST_CACHE_TAG}:unscoped"]
+        return [LIST_CACHE_TAG] + scope
+    
+    async def _invalidate_list_caches(
+        self,
+        category_ids: Optional[List[str]] = None,
+        brand_ids: Optional[List[str]] = None,
+        counts_changed: bool = True
+    ) -> None:
+        """Invalidate cached product lists that may include changed products.
         
-        if len(categories) != len(category_ids):
-            found_ids = {str(cat.id) for cat in categories}
-            missing_ids = set(category_ids) - found_ids
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Categories not found: {', '.join(missing_ids)}"
-            )
+        Cached category lists carry product counts and are dropped too when
+        counts may have changed. Brand lists are dropped when buffered brand
+        counts are flushed (see flush_brand_product_counts).
         
-        return list(categories)
+        Args:
+            category_ids: Categories of the changed products (before and after)
+            brand_ids: Brands of the changed products (before and after)
+            counts_changed: Whether category product counts may have changed
+        """
+        if not self.cache:
+            return
+        
+        tags = [f"{LIST_CACHE_TAG}:unscoped"]
+        if counts_changed:
+            tags.append(CATEGORY_LIST_CACHE_TAG)
+        tags.extend(f"{LIST_CACHE_TAG}:category:{cid}" for cid in category_ids or [])
+        tags.extend(f"{LIST_CACHE_TAG}:brand:{bid}" for bid in brand_ids or [] if bid)
+        await self.cache.invalidate_list_keys(*tags)
+    
+    async def _flush_checking_sku(self, sku: Optional[str]) -> None:
+        """Flush pending changes, reporting a duplicate SKU as a client error.
+        
+        Args:
+            sku: SKU being written, for the error message
+            
+        Raises:
+            HTTPException: If another ProductModel already uses the SKU
+        """
+        try:
+            await self.db.flush()
+        except IntegrityError as e:
+            await self.db.rollback()
+            if "sku" in str(e.orig):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"ProductModel with SKU '{sku}' already exists"
+                ) from e
+            raise
     
-    async def _validate_brand(self, brand_id: str) -> Brand:
-        """Validate that brand exists.
+    @request_memo
+    async def _validate_refs(
+        self,
+        category_ids: List[str],
+        brand_id: Optional[str] = None
+    ) -> Tuple[List[Category], Optional[Brand]]:
+        """Validate that categories and brand exist, in a single query.
+        
+        Both tables are outer-joined to a one-row anchor, so the result has
+        a row per found category, each carrying the brand (or NULL), and
+        still one row when nothing matches.
         
         Args:
-            brand_id: Brand ID
+            category_ids: List of category IDs
+            brand_id: Brand ID, if any
             
         Returns:
-            Brand object
+            Tuple of (category objects, brand object or None)
             
         Raises:
-            HTTPException: If brand not found
+            HTTPException: If any category or the brand is not found
         """
+        anchor = select(literal(1).label("anchor")).subquery()
         result = await self.db.execute(
-            select(Brand).where(Brand.id == brand_id)
+            select(Category, Brand)
+            .select_from(anchor)
+            .outerjoin(Category, Category.id.in_(category_ids) if category_ids else false())
+            .outerjoin(Brand, Brand.id == brand_id if brand_id else false())
         )
-        brand = result.scalar_one_or_none()
+        rows = result.all()
+        
+        categories = list({cat.id: cat for cat, _ in rows if cat is not None}.values())
+        brand = rows[0][1] if rows else None
         
-        if not brand:
+        if len(categories) != len(set(category_ids)):
+            found_ids = {str(cat.id) for cat in categories}
+            missing_ids = set(category_ids) - found_ids
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Categories not found: {', '.join(missing_ids)}"
+            )
+        
+        if brand_id and brand is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Brand not found: {brand_id}"
             )
         
-        return brand
+        return categories, brand
     
     async def _increment_view_count(self, product_id: str) -> None:
         """Increment ProductModel view count.
         
+        When a cache is available and the view count flusher is running,
+        the view is buffered in Redis and written to the database in
+        batches by flush_view_counts().
+        
         Args:
             product_id: ProductModel ID
         """
+        if self.cache and VIEW_COUNT_FLUSHER in _running_flushers:
+            if await self.cache.add_pending_product_view(str(product_id)) is not None:
+                return
+        
         await self.db.execute(
             update(ProductModel)
             .where(ProductModel.id == product_id)
@@ -786,44 +1493,282 @@ class ProductService:
         )
         await self.db.commit()
     
-    async def _update_category_product_counts(self, category_ids: List[str], increment: bool = True) -> None:
-        """Update ProductModel counts for categories.
+    @classmethod
+    async def flush_view_counts(cls, db_session: AsyncSession, cache_service: CacheService) -> int:
+        """Write buffered view counts from Redis to the database.
         
         Args:
-            category_ids: List of category IDs
-            increment: Whether to increment (True) or decrement (False)
+            db_session: Database session
+            cache_service: Cache service holding the pending views
+            
+        Returns:
+            Number of products whose view count was updated
         """
-        if increment:
-            await self.db.execute(
-                update(Category)
-                .where(Category.id.in_(category_ids))
-                .values(product_count=Category.product_count + 1)
-            )
-        else:
-            await self.db.execute(
-                update(Category)
-                .where(Category.id.in_(category_ids))
-                .values(product_count=func.greatest(Category.product_count - 1, 0))
+        pending = await cache_service.pop_pending_product_views()
+        if not pending:
+            return 0
+        
+        deltas = values(
+            column("id", PG_UUID(as_uuid=True)),
+            column("delta", Integer),
+            name="view_deltas"
+        ).data([(UUID(product_id), count) for product_id, count in pending.items()])
+        
+        try:
+            await db_session.execute(
+                update(ProductModel)
+                .where(ProductModel.id == deltas.c.id)
+                .values(view_count=ProductModel.view_count + deltas.c.delta)
             )
-        await self.db.commit()
+            await db_session.commit()
+        except Exception:
+            # Put the views back so the next flush retries them
+            await db_session.rollback()
+            for product_id, count in pending.items():
+                await cache_service.add_pending_product_view(product_id, count)
+            raise
+        
+        return len(pending)
+    
+    @classmethod
+    async def flush_brand_product_counts(cls, db_session: AsyncSession, cache_service: CacheService) -> int:
+        """Write buffered brand ProductModel count changes from Redis to the database.
+        
+        Args:
+            db_session: Database session
+            cache_service: Cache service holding the pending changes
+            
+        Returns:
+            Number of brands whose product count was updated
+        """
+        pending = await cache_service.pop_pending_brand_product_counts()
+        if not pending:
+            return 0
+        
+        try:
+            await db_session.execute(cls._count_update(Brand, pending))
+            await db_session.commit()
+        except Exception:
+            # Put the changes back so the next flush retries them
+            await db_session.rollback()
+            await cache_service.add_pending_brand_product_counts(pending)
+            raise
+        
+        # Cached brand lists carry the counts just written
+        await cache_service.invalidate_list_keys(BRAND_LIST_CACHE_TAG)
+        
+        return len(pending)
     
-    async def _update_brand_product_count(self, brand_id: str, increment: bool = True) -> None:
-        """Update ProductModel count for brand.
+    @classmethod
+    async def refresh_related_products(cls, db_session: AsyncSession) -> None:
+        """Rebuild the product_related materialized view.
         
         Args:
-            brand_id: Brand ID
-            increment: Whether to increment (True) or decrement (False)
+            db_session: Database session
         """
-        if increment:
-            await self.db.execute(
-                update(Brand)
-                .where(Brand.id == brand_id)
-                .values(product_count=Brand.product_count + 1)
+        await db_session.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY product_related"))
+        await db_session.commit()
+    
+    async def _stage_category_links(
+        self,
+        product_id: UUID,
+        category_ids: List[str]
+    ) -> Tuple[Set[str], Set[str]]:
+        """Replace a ProductModel's category links, diffing in SQL.
+        
+        Does not commit; the change is part of the caller's transaction.
+        
+        Args:
+            product_id: ProductModel ID
+            category_ids: Complete list of category IDs to link
+            
+        Returns:
+            Tuple of (added, removed) category IDs
+        """
+        result = await self.db.execute(
+            delete(product_categories)
+            .where(
+                and_(
+                    product_categories.c.product_id == product_id,
+                    product_categories.c.category_id.notin_(category_ids)
+                )
             )
-        else:
-            await self.db.execute(
-                update(Brand)
-                .where(Brand.id == brand_id)
-                .values(product_count=func.greatest(Brand.product_count - 1, 0))
+            .returning(product_categories.c.category_id)
+        )
+        removed = {str(category_id) for category_id in result.scalars().all()}
+        
+        added: Set[str] = set()
+        if category_ids:
+            result = await self.db.execute(
+                pg_insert(product_categories)
+                .values([
+                    {"product_id": product_id, "category_id": category_id}
+                    for category_id in category_ids
+                ])
+                .on_conflict_do_nothing()
+                .returning(product_categories.c.category_id)
             )
+            added = {str(category_id) for category_id in result.scalars().all()}
+        
+        return added, removed
+    
+    async def _stage_product_counts(
+        self,
+        category_deltas: Dict[str, int],
+        brand_deltas: Dict[str, int]
+    ) -> Dict[str, int]:
+        """Adjust category and brand ProductModel counts in one statement.
+        
+        When both change, the category UPDATE runs as a data-modifying CTE
+        of the brand UPDATE, so a single round-trip covers every row.
+        Does not commit; the change is part of the caller's transaction.
+        
+        When a cache is available and the brand count flusher is running,
+        brand counts are not written here, so concurrent writes do not
+        queue on hot brand rows. They are returned
+        for the caller to pass to _buffer_brand_counts() after committing.
+        
+        Args:
+            category_deltas: Mapping of category ID to count change
+            brand_deltas: Mapping of brand ID to count change
+            
+        Returns:
+            Brand count changes left to buffer after commit
+        """
+        deferred: Dict[str, int] = {}
+        if self.cache and BRAND_COUNT_FLUSHER in _running_flushers:
+            deferred, brand_deltas = brand_deltas, {}
+        
+        statements = [
+            self._count_update(model, deltas)
+            for model, deltas in ((Category, category_deltas), (Brand, brand_deltas))
+            if any(deltas.values())
+        ]
+        if statements:
+            statement = statements[-1]
+            if len(statements) == 2:
+                statement = statement.add_cte(
+                    statements[0].returning(Category.id).cte("category_counts")
+                )
+            await self.db.execute(statement)
+        
+        return deferred
+    
+    async def _buffer_brand_counts(self, brand_deltas: Dict[str, int]) -> None:
+        """Buffer committed brand ProductModel count changes in Redis.
+        
+        The changes are written to the database in batches by
+        flush_brand_product_counts(). If Redis cannot take them they are
+        written to the database right away instead of being lost.
+        
+        Args:
+            brand_deltas: Mapping of brand ID to count change
+        """
+        brand_deltas = {brand_id: delta for brand_id, delta in brand_deltas.items() if delta}
+        if not brand_deltas:
+            return
+        
+        if self.cache and await self.cache.add_pending_brand_product_counts(brand_deltas):
+            return
+        
+        await self.db.execute(self._count_update(Brand, brand_deltas))
         await self.db.commit()
+    
+    @staticmethod
+    def _count_update(
+        model: Union[Type[Category], Type[Brand]],
+        deltas: Dict[str, int]
+    ) -> Update:
+        """Build an UPDATE applying a different count change per row.
+        
+        Counts never drop below zero.
+        
+        Args:
+            model: Category or Brand
+            deltas: Mapping of ID to count change
+            
+        Returns:
+            UPDATE statement joined to the changes as a VALUES list
+        """
+        changes = values(
+            column("id", PG_UUID(as_uuid=True)),
+            column("delta", Integer),
+            name=f"{model.__tablename__}_deltas"
+        ).data([(UUID(str(row_id)), delta) for row_id, delta in deltas.items() if delta])
+        
+        return (
+            update(model)
+            .where(model.id == changes.c.id)
+            .values(product_count=func.greatest(model.product_count + changes.c.delta, 0))
+        )
+
+
+async def run_view_count_flusher(interval: int = settings.VIEW_COUNT_FLUSH_INTERVAL_SECONDS) -> None:
+    """Periodically flush buffered product views to the database.
+    
+    Runs until cancelled; started as a background task by the application
+    lifespan. Views are only buffered while it runs.
+    
+    Args:
+        interval: Seconds between flushes
+    """
+    _running_flushers.add(VIEW_COUNT_FLUSHER)
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                cache = await get_cache_service()
+                async with get_session_factory()() as session:
+                    flushed = await ProductService.flush_view_counts(session, cache)
+                if flushed:
+                    logger.debug(f"Flushed view counts for {flushed} products")
+            except Exception as e:
+                logger.error(f"Failed to flush product view counts: {e}")
+    finally:
+        _running_flushers.discard(VIEW_COUNT_FLUSHER)
+
+
+async def run_brand_count_flusher(interval: int = settings.BRAND_COUNT_FLUSH_INTERVAL_SECONDS) -> None:
+    """Periodically flush buffered brand product counts to the database.
+    
+    Runs until cancelled; started as a background task by the application
+    lifespan. Brand counts are only buffered while it runs.
+    
+    Args:
+        interval: Seconds between flushes
+    """
+    _running_flushers.add(BRAND_COUNT_FLUSHER)
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                cache = await get_cache_service()
+                async with get_session_factory()() as session:
+                    flushed = await ProductService.flush_brand_product_counts(session, cache)
+                if flushed:
+                    logger.debug(f"Flushed product counts for {flushed} brands")
+            except Exception as e:
+                logger.error(f"Failed to flush brand product counts: {e}")
+    finally:
+        _running_flushers.discard(BRAND_COUNT_FLUSHER)
+
+
+async def run_related_products_refresher(
+    interval: int = settings.RELATED_PRODUCTS_REFRESH_INTERVAL_SECONDS
+) -> None:
+    """Periodically refresh the related-products materialized view.
+    
+    Runs until cancelled; started as a background task by the application
+    lifespan. The first refresh runs right away so links written while the
+    application was down are picked up.
+    
+    Args:
+        interval: Seconds between refreshes
+    """
+    while True:
+        try:
+            async with get_session_factory()() as session:
+                await ProductService.refresh_related_products(session)
+        except Exception as e:
+            logger.error(f"Failed to refresh related products: {e}")
+        await asyncio.sleep(interval)
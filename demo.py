@@ -6,182 +6,288 @@ external dependencies like PostgreSQL or Redis.
 """
 
 import asyncio
+import hashlib
 import sys
+from contextlib import asynccontextmanager
+from importlib.util import find_spec
 from pathlib import Path
 
 # Add the app directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+import anyio.to_thread
+import orjson
 import uvicorn
 
 
+# Static demo fixtures served by the endpoints below
+ROOT_PAYLOAD = {
+    "message": "Welcome to E-Commerce Product Catalog Microservice",
+    "version": "1.0.0",
+    "status": "running",
+    "docs": "/docs",
+    "redoc": "/redoc"
+}
+
+HEALTH_PAYLOAD = {
+    "status": "healthy",
+    "service": "E-Commerce Product Catalog",
+    "version": "1.0.0",
+    "timestamp": "2024-01-01T00:00:00Z",
+    "environment": "demo"
+}
+
+PRODUCTS_PAYLOAD = {
+    "products": [
+        {
+            "id": "123e4567-e89b-12d3-a456-426614174000",
+            "name": "iPhone 15 Pro",
+            "description": "Latest iPhone with advanced features",
+            "price": 999.99,
+            "currency": "USD",
+            "sku": "IPHONE-15-PRO-128",
+            "stock_quantity": 100,
+            "status": "active",
+            "is_featured": True,
+            "category": "Electronics",
+            "brand": "Apple"
+        },
+        {
+            "id": "456e7890-e89b-12d3-a456-426614174001",
+            "name": "Samsung Galaxy S24",
+            "description": "Premium Android smartphone",
+            "price": 899.99,
+            "currency": "USD",
+            "sku": "GALAXY-S24-256",
+            "stock_quantity": 75,
+            "status": "active",
+            "is_featured": True,
+            "category": "Electronics",
+            "brand": "Samsung"
+        }
+    ],
+    "total": 2,
+    "page": 1,
+    "per_page": 20
+}
+
+CATEGORIES_PAYLOAD = {
+    "categories": [
+        {
+            "id": "789e0123-e89b-12d3-a456-426614174002",
+            "name": "Electronics",
+            "slug": "electronics",
+            "description": "Electronic devices and gadgets",
+            "product_count": 150,
+            "is_active": True,
+            "is_featured": True
+        },
+        {
+            "id": "012e3456-e89b-12d3-a456-426614174003",
+            "name": "Clothing",
+            "slug": "clothing",
+            "description": "Fashion and apparel",
+            "product_count": 200,
+            "is_active": True,
+            "is_featured": False
+        }
+    ],
+    "total": 2
+}
+
+BRANDS_PAYLOAD = {
+    "brands": [
+        {
+            "id": "345e6789-e89b-12d3-a456-426614174004",
+            "name": "Apple",
+            "slug": "apple",
+            "description": "Technology company known for innovative products",
+            "website": "https://www.apple.com",
+            "product_count": 50,
+            "rating": 4.5,
+            "is_featured": True,
+            "is_verified": True
+        },
+        {
+            "id": "678e9012-e89b-12d3-a456-426614174005",
+            "name": "Samsung",
+            "slug": "samsung",
+            "description": "South Korean multinational electronics company",
+            "website": "https://www.samsung.com",
+            "product_count": 75,
+            "rating": 4.3,
+            "is_featured": True,
+            "is_verified": True
+        }
+    ],
+    "total": 2
+}
+
+CURRENT_USER_PAYLOAD = {
+    "message": "Authentication required",
+    "note": "This is a demo endpoint. In production, this would return the current user's information."
+}
+
+
+# Startup banner, written in one call by main()
+BANNER = f"""\
+🚀 Starting E-Commerce Product Catalog Microservice Demo
+📝 This is a demonstration version without database dependencies
+🔗 API Documentation will be available at: http://localhost:8000/docs
+🔗 ReDoc Documentation will be available at: http://localhost:8000/redoc
+
+📋 Available Demo Endpoints:
+   GET /                     - Root endpoint
+   GET /health               - Health check
+   GET /api/v1/products      - List products
+   GET /api/v1/categories    - List categories
+   GET /api/v1/brands        - List brands
+   GET /api/v1/auth/me       - Current user (demo)
+
+⚠️  Note: This demo doesn't include database operations.
+   For full functionality, set up PostgreSQL and Redis as described in README.md
+
+{"=" * 70}
+"""
+
+
+# orjson options for every demo response: UUIDs, datetimes and non-string
+# keys are encoded natively, with naive datetimes treated as UTC ("Z")
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+class FastORJSONResponse(ORJSONResponse):
+    """ORJSONResponse rendering with the demo's fixed orjson options."""
+    
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+# Worker threads for sync handlers and middleware (anyio defaults to 40)
+DEMO_THREADPOOL_SIZE = 100
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Size the worker thread pool before serving requests."""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = DEMO_THREADPOOL_SIZE
+    yield
+
+
+# Fixtures are immutable, so clients and proxies may reuse them for an hour
+STATIC_CACHE_CONTROL = "public, max-age=3600"
+
+
+def static_json_response(request: Request, body: bytes, etag: str) -> Response:
+    """Serve a pre-serialized fixture, answering revalidations with 304.
+    
+    Args:
+        request: Incoming request
+        body: Serialized JSON body
+        etag: Weak entity tag of the body
+        
+    Returns:
+        The JSON response, or an empty 304 if the client's copy is current
+    """
+    headers = {"ETag": etag, "Cache-Control": STATIC_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match", "")
+    # If-None-Match uses weak comparison, so compare the opaque tags alone
+    client_tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if "*" in client_tags or etag.removeprefix("W/") in client_tags:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
 def create_demo_app():
     """Create a demo FastAPI app without database dependencies."""
     
+    # The fixtures never change, so serialize them once up front
+    root_body = orjson.dumps(ROOT_PAYLOAD, option=ORJSON_OPTIONS)
+    health_body = orjson.dumps(HEALTH_PAYLOAD, option=ORJSON_OPTIONS)
+    products_body = orjson.dumps(PRODUCTS_PAYLOAD, option=ORJSON_OPTIONS)
+    categories_body = orjson.dumps(CATEGORIES_PAYLOAD, option=ORJSON_OPTIONS)
+    brands_body = orjson.dumps(BRANDS_PAYLOAD, option=ORJSON_OPTIONS)
+    current_user_body = orjson.dumps(CURRENT_USER_PAYLOAD, option=ORJSON_OPTIONS)
+    
+    # Entity tags for the cacheable fixtures; weak because GZipMiddleware
+    # serves gzip and identity representations under the same tag
+    root_etag, products_etag, categories_etag, brands_etag = (
+        f'W/"{hashlib.sha256(body).hexdigest()}"'
+        for body in (root_body, products_body, categories_body, brands_body)
+    )
+    
     app = FastAPI(
         title="E-Commerce Product Catalog Microservice",
         description="A comprehensive e-commerce product catalog microservice",
         version="1.0.0",
         docs_url="/docs",
-        redoc_url="/redoc"
+        redoc_url="/redoc",
+        default_response_class=FastORJSONResponse,
+        lifespan=lifespan
     )
     
+    # The fixtures repeat the same keys per item and compress well
+    app.add_middleware(GZipMiddleware, minimum_size=200, compresslevel=5)
+    
     @app.get("/")
-    async def root():
+    async def root(request: Request):
         """Root endpoint."""
-        return {
-            "message": "Welcome to E-Commerce Product Catalog Microservice",
-            "version": "1.0.0",
-            "status": "running",
-            "docs": "/docs",
-            "redoc": "/redoc"
-        }
+        return static_json_response(request, root_body, root_etag)
     
     @app.get("/health")
     async def health_check():
         """Health check endpoint."""
-        return {
-            "status": "healthy",
-            "service": "E-Commerce Product Catalog",
-            "version": "1.0.0",
-            "timestamp": "2024-01-01T00:00:00Z",
-            "environment": "demo"
-        }
+        return Response(health_body, media_type="application/json")
     
     @app.get("/api/v1/products")
-    async def get_products():
+    async def get_products(request: Request):
         """Demo products endpoint."""
-        return {
-            "products": [
-                {
-                    "id": "123e4567-e89b-12d3-a456-426614174000",
-                    "name": "iPhone 15 Pro",
-                    "description": "Latest iPhone with advanced features",
-                    "price": 999.99,
-                    "currency": "USD",
-                    "sku": "IPHONE-15-PRO-128",
-                    "stock_quantity": 100,
-                    "status": "active",
-                    "is_featured": True,
-                    "category": "Electronics",
-                    "brand": "Apple"
-                },
-                {
-                    "id": "456e7890-e89b-12d3-a456-426614174001",
-                    "name": "Samsung Galaxy S24",
-                    "description": "Premium Android smartphone",
-                    "price": 899.99,
-                    "currency": "USD",
-                    "sku": "GALAXY-S24-256",
-                    "stock_quantity": 75,
-                    "status": "active",
-                    "is_featured": True,
-                    "category": "Electronics",
-                    "brand": "Samsung"
-                }
-            ],
-            "total": 2,
-            "page": 1,
-            "per_page": 20
-        }
+        return static_json_response(request, products_body, products_etag)
     
     @app.get("/api/v1/categories")
-    async def get_categories():
+    async def get_categories(request: Request):
         """Demo categories endpoint."""
-        return {
-            "categories": [
-                {
-                    "id": "789e0123-e89b-12d3-a456-426614174002",
-                    "name": "Electronics",
-                    "slug": "electronics",
-                    "description": "Electronic devices and gadgets",
-                    "product_count": 150,
-                    "is_active": True,
-                    "is_featured": True
-                },
-                {
-                    "id": "012e3456-e89b-12d3-a456-426614174003",
-                    "name": "Clothing",
-                    "slug": "clothing",
-                    "description": "Fashion and apparel",
-                    "product_count": 200,
-                    "is_active": True,
-                    "is_featured": False
-                }
-            ],
-            "total": 2
-        }
+        return static_json_response(request, categories_body, categories_etag)
     
     @app.get("/api/v1/brands")
-    async def get_brands():
+    async def get_brands(request: Request):
         """Demo brands endpoint."""
-        return {
-            "brands": [
-                {
-                    "id": "345e6789-e89b-12d3-a456-426614174004",
-                    "name": "Apple",
-                    "slug": "apple",
-                    "description": "Technology company known for innovative products",
-                    "website": "https://www.apple.com",
-                    "product_count": 50,
-                    "rating": 4.5,
-                    "is_featured": True,
-                    "is_verified": True
-                },
-                {
-                    "id": "678e9012-e89b-12d3-a456-426614174005",
-                    "name": "Samsung",
-                    "slug": "samsung",
-                    "description": "South Korean multinational electronics company",
-                    "website": "https://www.samsung.com",
-                    "product_count": 75,
-                    "rating": 4.3,
-                    "is_featured": True,
-                    "is_verified": True
-                }
-            ],
-            "total": 2
-        }
+        return static_json_response(request, brands_body, brands_etag)
     
     @app.get("/api/v1/auth/me")
     async def get_current_user():
         """Demo current user endpoint."""
-        return {
-            "message": "Authentication required",
-            "note": "This is a demo endpoint. In production, this would return the current user's information."
-        }
+        return Response(current_user_body, media_type="application/json")
     
     return app
 
 
 def main():
     """Run the demo application."""
-    print("🚀 Starting E-Commerce Product Catalog Microservice Demo")
-    print("📝 This is a demonstration version without database dependencies")
-    print("🔗 API Documentation will be available at: http://localhost:8000/docs")
-    print("🔗 ReDoc Documentation will be available at: http://localhost:8000/redoc")
-    print("\n📋 Available Demo Endpoints:")
-    print("   GET /                     - Root endpoint")
-    print("   GET /health               - Health check")
-    print("   GET /api/v1/products      - List products")
-    print("   GET /api/v1/categories    - List categories")
-    print("   GET /api/v1/brands        - List brands")
-    print("   GET /api/v1/auth/me       - Current user (demo)")
-    print("\n⚠️  Note: This demo doesn't include database operations.")
-    print("   For full functionality, set up PostgreSQL and Redis as described in README.md")
-    print("\n" + "="*70)
+    sys.stdout.write(BANNER)
+    sys.stdout.flush()
     
     app = create_demo_app()
     
     try:
+        # Prefer the C-accelerated event loop and HTTP parser from
+        # uvicorn[standard]; uvloop is not available on Windows
         uvicorn.run(
             app,
             host="0.0.0.0",
             port=8000,
             reload=False,
-            log_level="info"
+            loop="uvloop" if find_spec("uvloop") else "asyncio",
+            http="httptools" if find_spec("httptools") else "h11",
+            log_level="info",
+            access_log=False,
+            # Headroom for burst load during demos
+            limit_concurrency=1000,
+            backlog=2048,
+            timeout_keep_alive=30
         )
     except KeyboardInterrupt:
         print("\n👋 Demo stopped. Thank you for trying the E-Commerce Product Catalog Microservice!")